@@ -83,7 +83,9 @@ class StreamPrinter:
 
     def _println(self, text: str) -> None:
         with self._print_lock:
-            sys.stdout.write(text + "\n")
+            # Two writes avoid copying potentially large output just to append a newline
+            sys.stdout.write(text)
+            sys.stdout.write("\n")
             sys.stdout.flush()
 
     def _print_inline(self, text: str) -> None:
@@ -48,7 +48,8 @@ class ToolStepEvent(BaseStreamEvent):
     args: dict[str, Any] = Field(default_factory=dict)
     result_summary: str | None = None
     # Optional richer fields for UI/observability; backward compatible
-    status: Literal["start", "success", "error"] | None = None
+    # "completed" is a start and success in one step (opt-in, see MAGENT2_FUSE_ORPHAN_TOOL_STEPS)
+    status: Literal["start", "success", "error", "completed"] | None = None
     error: str | None = None
     duration_ms: int | None = None
     tool_call_id: str | None = None
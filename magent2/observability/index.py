@@ -1,11 +1,16 @@
 from __future__ import annotations
 
+import heapq
 import os
 from collections.abc import Iterable
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from queue import Empty, Full, LifoQueue
 from typing import Any
 
+# Reusable pipelines kept per index; writes rent one instead of allocating a fresh Pipeline
+_PIPE_POOL_SIZE = 8
+
 
 def _now_ms() -> int:
     return int(datetime.now(UTC).timestamp() * 1000)
@@ -40,9 +45,22 @@ def _cap_recent_set(client: Any, key: str, cap: int) -> None:
         pass
 
 
-@dataclass
+@dataclass(slots=True)
 class ObserverIndex:
+    """Redis-backed index of conversations, agents and message edges for the observer UI.
+
+    Build it with `from_bus` or `from_client`: when OBS_INDEX_ENABLED is off or there is no
+    client they return a `_DisabledObserverIndex`, whose methods return empty results
+    immediately, so hot-path callers pay no env parsing per event.
+    """
+
     client: Any | None
+    _pipe_pool: LifoQueue[Any] = field(
+        default_factory=lambda: LifoQueue(maxsize=_PIPE_POOL_SIZE),
+        init=False,
+        repr=False,
+        compare=False,
+    )
 
     @classmethod
     def from_bus(cls, bus: Any) -> ObserverIndex:
@@ -50,20 +68,41 @@ class ObserverIndex:
             from magent2.bus.redis_adapter import RedisBus  # local import to avoid hard dep
 
             if isinstance(bus, RedisBus):
-                return cls(client=bus.get_client())
+                return cls.from_client(bus.get_client())
         except Exception:
             pass
-        return cls(client=None)
+        return cls.from_client(None)
+
+    @classmethod
+    def from_client(cls, client: Any | None) -> ObserverIndex:
+        if not _enabled() or client is None:
+            return _DisabledObserverIndex(client=None)
+        return cls(client=client)
 
     def is_active(self) -> bool:
-        return _enabled() and self.client is not None
+        return self.client is not None
+
+    def _rent_pipeline(self, c: Any) -> Any:
+        try:
+            return self._pipe_pool.get_nowait()
+        except Empty:
+            return c.pipeline(transaction=False)
+
+    def _return_pipeline(self, pipe: Any) -> None:
+        try:
+            # reset() clears the command stack and releases the connection
+            pipe.reset()
+            self._pipe_pool.put_nowait(pipe)
+        except Full:
+            pass
+        except Exception:
+            # A pipeline that failed to reset is dropped rather than reused
+            pass
 
     # --- Writes ---
     def record_user_message(
         self, conversation_id: str, sender: str, recipient: str, text: str | None, ts_ms: int | None
     ) -> None:
-        if not self.is_active():
-            return
         cid = str(conversation_id)
         sender = str(sender)
         recipient = str(recipient)
@@ -72,8 +111,9 @@ class ObserverIndex:
         if c is None:
             return
         ttl = _ttl_seconds()
+        pipe: Any = None
         try:
-            pipe = c.pipeline(transaction=False)
+            pipe = self._rent_pipeline(c)
             # zset of conversations by last activity
             pipe.zadd("obs:conv:z", {cid: ts})
             # hash with basic metadata
@@ -102,10 +142,11 @@ class ObserverIndex:
         except Exception:
             # best-effort only
             pass
+        finally:
+            if pipe is not None:
+                self._return_pipeline(pipe)
 
     def record_run_started(self, agent_name: str, conversation_id: str, ts_ms: int | None) -> None:
-        if not self.is_active():
-            return
         name = str(agent_name)
         cid = str(conversation_id)
         ts = int(ts_ms if ts_ms is not None else _now_ms())
@@ -113,8 +154,9 @@ class ObserverIndex:
         if c is None:
             return
         ttl = _ttl_seconds()
+        pipe: Any = None
         try:
-            pipe = c.pipeline(transaction=False)
+            pipe = self._rent_pipeline(c)
             pipe.zadd("obs:agents:z", {name: ts})
             hkey = f"obs:agent:{name}:h"
             pipe.hset(hkey, mapping={"last_seen_ms": ts, "last_started_ms": ts})
@@ -127,12 +169,13 @@ class ObserverIndex:
             _cap_recent_set(c, skey, 50)
         except Exception:
             pass
+        finally:
+            if pipe is not None:
+                self._return_pipeline(pipe)
 
     def record_run_completed(
         self, agent_name: str, conversation_id: str, ts_ms: int | None, *, errored: bool
     ) -> None:
-        if not self.is_active():
-            return
         name = str(agent_name)
         cid = str(conversation_id)
         ts = int(ts_ms if ts_ms is not None else _now_ms())
@@ -140,8 +183,9 @@ class ObserverIndex:
         if c is None:
             return
         ttl = _ttl_seconds()
+        pipe: Any = None
         try:
-            pipe = c.pipeline(transaction=False)
+            pipe = self._rent_pipeline(c)
             pipe.zadd("obs:agents:z", {name: ts})
             hkey = f"obs:agent:{name}:h"
             pipe.hset(hkey, mapping={"last_seen_ms": ts, "last_completed_ms": ts})
@@ -166,6 +210,9 @@ class ObserverIndex:
             _cap_recent_set(c, skey, 50)
         except Exception:
             pass
+        finally:
+            if pipe is not None:
+                self._return_pipeline(pipe)
 
     # --- Reads ---
     def _process_conversation_data(self, c: Any, cid: str) -> dict[str, Any]:
@@ -190,8 +237,6 @@ class ObserverIndex:
     def list_conversations(
         self, limit: int = 50, since_ms: int | None = None
     ) -> list[dict[str, Any]]:
-        if not self.is_active():
-            return []
         c = self.client
         if c is None:
             return []
@@ -240,8 +285,6 @@ class ObserverIndex:
         }
 
     def list_agents(self, limit: int = 200) -> list[dict[str, Any]]:
-        if not self.is_active():
-            return []
         c = self.client
         if c is None:
             return []
@@ -266,12 +309,14 @@ class ObserverIndex:
             nodes.append({"id": pid, "type": ntype})
         return nodes
 
-    def _extract_edges(self, c: Any, cid: str) -> list[dict[str, Any]]:
-        """Extract conversation edges from Redis."""
+    def _extract_edges(self, c: Any, cid: str, max_edges: int = 500) -> list[dict[str, Any]]:
+        """Extract conversation edges from Redis, keeping the max_edges highest-count ones.
+
+        The edges hash is read in one HGETALL; only the response size is capped.
+        """
         ekey = f"obs:conv:{cid}:edges"
-        edges_raw = c.hgetall(ekey)
         edges = []
-        for key_raw, val_raw in edges_raw.items():
+        for key_raw, val_raw in c.hgetall(ekey).items():
             pair = key_raw.decode() if isinstance(key_raw, (bytes | bytearray)) else str(key_raw)
             val_text = (
                 val_raw.decode() if isinstance(val_raw, (bytes | bytearray)) else str(val_raw)
@@ -283,25 +328,24 @@ class ObserverIndex:
             if "|" in pair:
                 frm, to = pair.split("|", 1)
                 edges.append({"from": frm, "to": to, "count": count})
-        return edges
+        limit = max(0, int(max_edges))
+        if len(edges) <= limit:
+            return edges
+        return heapq.nlargest(limit, edges, key=lambda e: e["count"])
 
-    def get_graph(self, conversation_id: str) -> dict[str, Any] | None:
-        if not self.is_active():
-            return {"nodes": [], "edges": []}
+    def get_graph(self, conversation_id: str, max_edges: int = 500) -> dict[str, Any] | None:
         c = self.client
         if c is None:
             return {"nodes": [], "edges": []}
         cid = str(conversation_id)
         try:
             nodes = self._extract_nodes(c, cid)
-            edges = self._extract_edges(c, cid)
+            edges = self._extract_edges(c, cid, max_edges)
             return {"nodes": nodes, "edges": edges}
         except Exception:
             return {"nodes": [], "edges": []}
 
     def conversation_exists(self, conversation_id: str) -> bool:
-        if not self.is_active():
-            return False
         c = self.client
         if c is None:
             return False
@@ -310,3 +354,40 @@ class ObserverIndex:
             return bool(int(c.exists(f"obs:conv:{cid}:h") or 0))
         except Exception:
             return False
+
+
+class _DisabledObserverIndex(ObserverIndex):
+    """No-op index used when observability indexing is disabled or no client exists."""
+
+    # Keep instances free of a __dict__, like the slotted parent
+    __slots__ = ()
+
+    def is_active(self) -> bool:
+        return False
+
+    def record_user_message(
+        self, conversation_id: str, sender: str, recipient: str, text: str | None, ts_ms: int | None
+    ) -> None:
+        return None
+
+    def record_run_started(self, agent_name: str, conversation_id: str, ts_ms: int | None) -> None:
+        return None
+
+    def record_run_completed(
+        self, agent_name: str, conversation_id: str, ts_ms: int | None, *, errored: bool
+    ) -> None:
+        return None
+
+    def list_conversations(
+        self, limit: int = 50, since_ms: int | None = None
+    ) -> list[dict[str, Any]]:
+        return []
+
+    def list_agents(self, limit: int = 200) -> list[dict[str, Any]]:
+        return []
+
+    def get_graph(self, conversation_id: str, max_edges: int = 500) -> dict[str, Any] | None:
+        return {"nodes": [], "edges": []}
+
+    def conversation_exists(self, conversation_id: str) -> bool:
+        return False
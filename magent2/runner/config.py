@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import dataclasses
 import os
 from dataclasses import dataclass
 from typing import Any
@@ -15,6 +16,30 @@ class RunnerConfig:
     max_turns: int
 
 
+# Environment keys that influence the parsed config; used as the cache fingerprint
+_CONFIG_ENV_KEYS: tuple[str, ...] = (
+    "OPENAI_API_KEY",
+    "AGENT_NAME",
+    "AGENT_MODEL",
+    "AGENT_MAX_TURNS",
+    "AGENT_INSTRUCTIONS_FILE",
+    "AGENT_INSTRUCTIONS",
+    "AGENT_TOOLS",
+)
+
+_CONFIG_CACHE: dict[tuple[Any, ...], RunnerConfig] = {}
+_CONFIG_CACHE_MAX = 32
+
+
+def _instructions_mtime_ns(path: str | None) -> int | None:
+    if not path:
+        return None
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+
+
 def _read_instructions() -> str:
     path = os.getenv("AGENT_INSTRUCTIONS_FILE")
     if path:
@@ -37,8 +62,15 @@ def _read_tools() -> list[str]:
     return [t.strip() for t in raw.split(",") if t.strip()]
 
 
-def load_config(env: dict[str, str] | None = None) -> RunnerConfig:
-    e: dict[str, Any] = dict(os.environ)
+def _config_cache_key(env: dict[str, str] | None) -> tuple[Any, ...]:
+    environ_values = tuple(os.environ.get(k) for k in _CONFIG_ENV_KEYS)
+    overrides = tuple(sorted(env.items())) if env else ()
+    mtime_ns = _instructions_mtime_ns(os.environ.get("AGENT_INSTRUCTIONS_FILE"))
+    return environ_values, overrides, mtime_ns
+
+
+def _build_config(env: dict[str, str] | None) -> RunnerConfig:
+    e: dict[str, Any] = {k: os.environ[k] for k in _CONFIG_ENV_KEYS if k in os.environ}
     if env:
         e.update(env)
     # Parse max turns from env with sensible default
@@ -63,4 +95,26 @@ def load_config(env: dict[str, str] | None = None) -> RunnerConfig:
     )
 
 
-__all__ = ["RunnerConfig", "load_config"]
+def load_config(env: dict[str, str] | None = None) -> RunnerConfig:
+    """Return the runner config for the current environment.
+
+    Parsed configs are cached by an env fingerprint (relevant keys, overrides and the
+    instructions file mtime), so repeated calls skip the env scan and file read.
+    """
+    key = _config_cache_key(env)
+    cfg = _CONFIG_CACHE.get(key)
+    if cfg is None:
+        cfg = _build_config(env)
+        if len(_CONFIG_CACHE) >= _CONFIG_CACHE_MAX:
+            _CONFIG_CACHE.clear()
+        _CONFIG_CACHE[key] = cfg
+    # Hand out a copy so callers mutating the result cannot poison the cache
+    return dataclasses.replace(cfg, tools=list(cfg.tools))
+
+
+def clear_config_cache() -> None:
+    """Drop cached configs so the next load_config call re-reads the environment."""
+    _CONFIG_CACHE.clear()
+
+
+__all__ = ["RunnerConfig", "clear_config_cache", "load_config"]
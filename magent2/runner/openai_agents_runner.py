@@ -1,13 +1,22 @@
 from __future__ import annotations
 
 import asyncio
+import atexit
+import concurrent.futures
+import contextvars
+import io
 import json
 import os
+import secrets
 import threading
-from collections import deque
-from collections.abc import Iterable
-from queue import Full, Queue
-from typing import Any, cast
+import time
+from collections import OrderedDict, defaultdict, deque
+from collections.abc import AsyncGenerator, Awaitable, Callable, Iterable
+from contextlib import aclosing
+from dataclasses import dataclass, field
+from functools import partial
+from itertools import count
+from typing import Any, TypeVar, cast
 
 from agents import Agent
 from agents import Runner as SDKRunner
@@ -20,7 +29,431 @@ from magent2.models.envelope import (
     TokenEvent,
     ToolStepEvent,
 )
-from magent2.observability import get_json_logger, get_run_context, use_run_context
+from magent2.observability import get_json_logger
+
+
+# Field lookup tables for SDK run items. Each step is (source, names, keyed) tried in order, where
+# source is an `_ItemSources` slot and keyed selects dict access over attribute access.
+_FieldSpec = tuple[tuple[str, tuple[str, ...], bool], ...]
+_TOOL_NAME_KEYS = ("name", "tool_name", "tool")
+_ARGS_KEYS = ("arguments", "args", "input", "parameters")
+_RESULT_KEYS = ("result", "output_text", "output", "content", "tool_result")
+_CALL_ID_KEYS = ("id", "tool_call_id", "call_id")
+
+_NAME_SPEC: _FieldSpec = (
+    ("item", ("name",), False),
+    ("tool", ("name",), False),
+    ("item", ("tool_name", "tool"), False),
+    ("raw", ("name",), False),
+    ("raw_dict", _TOOL_NAME_KEYS, True),
+    ("item_dict", _TOOL_NAME_KEYS, True),
+)
+_ARGS_SPEC: _FieldSpec = (
+    ("item", ("arguments",), False),
+    ("tool", ("arguments", "input"), False),
+    ("raw", ("arguments",), False),
+    ("raw_dict", _ARGS_KEYS, True),
+    ("item_dict", _ARGS_KEYS, True),
+)
+_RESULT_SPEC: _FieldSpec = (
+    ("item", ("result", "output", "content"), False),
+    ("raw", _RESULT_KEYS, False),
+    ("raw_dict", _RESULT_KEYS, True),
+    ("item_dict", _RESULT_KEYS, True),
+)
+_CALL_ID_SPEC: _FieldSpec = (
+    ("item", _CALL_ID_KEYS, False),
+    ("raw", _CALL_ID_KEYS, False),
+    ("raw_dict", _CALL_ID_KEYS, True),
+    ("item_dict", _CALL_ID_KEYS, True),
+)
+# Plain dict items have no attributes to probe; only their keys can match
+_DICT_NAME_SPEC: _FieldSpec = (("item_dict", _TOOL_NAME_KEYS, True),)
+_DICT_ARGS_SPEC: _FieldSpec = (("item_dict", _ARGS_KEYS, True),)
+_DICT_RESULT_SPEC: _FieldSpec = (("item_dict", _RESULT_KEYS, True),)
+
+# Run item types seen from the Agents SDK, checked before the substring rules in
+# `_is_tool_call` / `_is_tool_result` (which still classify anything not listed here)
+_TOOL_CALL_TYPES = frozenset({"tool_call_item", "tool_call"})
+_TOOL_RESULT_TYPES = frozenset({"tool_call_output_item", "tool_call_output"})
+
+# Markers that flag a run item as the final output
+_FINAL_FLAG_ATTRS = ("final", "is_final", "completed")
+_FINAL_DICT_KEYS = ("final", "is_final", "completed", "status")
+_FINAL_VALUES = frozenset({True, "completed", "done", "final"})
+
+
+def _dict_marks_final(item: dict[str, Any]) -> bool:
+    get = item.get
+    # The type/kind discriminator decides most dict items on its own
+    kind = get("kind") or get("type") or ""
+    if isinstance(kind, str) and "completed" in kind:
+        return True
+    for key in _FINAL_DICT_KEYS:
+        try:
+            if get(key) in _FINAL_VALUES:
+                return True
+        except TypeError:
+            # Unhashable values cannot be a final marker
+            pass
+    return False
+
+
+def _is_nonempty_str(value: Any) -> bool:
+    return isinstance(value, str) and bool(value)
+
+
+def _is_not_none(value: Any) -> bool:
+    return value is not None
+
+
+@dataclass(slots=True)
+class _ItemSources:
+    """The places a field can live on an SDK run item, resolved once per item."""
+
+    item: Any
+    tool: Any
+    raw: Any
+    raw_dict: dict[str, Any] | None
+    item_dict: dict[str, Any] | None
+
+    @classmethod
+    def of(cls, item: Any) -> _ItemSources:
+        raw = getattr(item, "raw_item", None)
+        return cls(
+            item,
+            getattr(item, "tool", None),
+            raw,
+            raw if isinstance(raw, dict) else None,
+            item if isinstance(item, dict) else None,
+        )
+
+    def first(self, spec: _FieldSpec, accept: Callable[[Any], bool]) -> Any:
+        """Return the first value accepted by `accept`, following `spec` in order."""
+        for source, names, keyed in spec:
+            obj = getattr(self, source)
+            if obj is None:
+                continue
+            if keyed:
+                get = obj.get
+                for name in names:
+                    value = get(name)
+                    if accept(value):
+                        return value
+            else:
+                for name in names:
+                    value = getattr(obj, name, None)
+                    if accept(value):
+                        return value
+        return None
+
+
+def _fast_tool_call_item(item: Any) -> tuple[Any, Any, Any] | None:
+    raw = item.raw_item
+    if type(raw).__name__ != "ResponseFunctionToolCall" or not _is_nonempty_str(raw.name):
+        return None
+    return raw.name, raw.arguments, None
+
+
+def _fast_message_output_item(item: Any) -> tuple[Any, Any, Any] | None:
+    raw = item.raw_item
+    if type(raw).__name__ != "ResponseOutputMessage":
+        return None
+    return None, None, raw.content
+
+
+def _fast_plain_dict(item: Any) -> tuple[Any, Any, Any] | None:
+    if type(item) is not dict:
+        return None
+    sources = _ItemSources(item, None, None, None, item)
+    return (
+        sources.first(_DICT_NAME_SPEC, _is_nonempty_str),
+        sources.first(_DICT_ARGS_SPEC, _is_not_none),
+        sources.first(_DICT_RESULT_SPEC, _is_not_none),
+    )
+
+
+# (name, args, result) extractors keyed by run item class name: the SDK's item classes (read
+# straight off raw_item) and plain dicts (keys only). Each yields what the generic
+# `_ItemSources.first` lookup would for that shape; None (or AttributeError) defers to it.
+_FAST_EXTRACTORS: dict[str, Callable[[Any], tuple[Any, Any, Any] | None]] = {
+    "ToolCallItem": _fast_tool_call_item,
+    "MessageOutputItem": _fast_message_output_item,
+    "dict": _fast_plain_dict,
+}
+
+
+class _LRUDict(OrderedDict[str, Any]):
+    """OrderedDict capped at `maxlen` entries; inserting past the cap drops the oldest."""
+
+    def __init__(self, maxlen: int) -> None:
+        super().__init__()
+        self.maxlen = maxlen
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        if len(self) > self.maxlen:
+            self.popitem(last=False)
+
+
+def _tool_cache_max() -> int:
+    try:
+        return max(1, int(os.getenv("MAGENT2_TOOL_CACHE_MAX", "4096")))
+    except ValueError:
+        return 4096
+
+
+def _token_coalesce_s() -> float:
+    try:
+        return max(0.0, float(os.getenv("MAGENT2_TOKEN_COALESCE_MS", "0"))) / 1000
+    except ValueError:
+        return 0.0
+
+
+# Pending token text that flushes a coalesced TokenEvent before its window runs out
+_COALESCE_MAX_CHARS = 32
+
+
+@dataclass(slots=True)
+class _TokenBatch:
+    """Token text pending in one coalescing window, plus the running output index."""
+
+    window_s: float
+    first: TokenEvent | None = None
+    texts: list[str] = field(default_factory=list)
+    chars: int = 0
+    deadline: float = 0.0
+    index: int = 0
+
+    def add(self, token: TokenEvent, now: float) -> bool:
+        """Queue a token's text; returns True once enough text is pending to flush early."""
+        if self.first is None:
+            self.first = token
+            self.deadline = now + self.window_s
+        self.texts.append(token.text)
+        self.chars += len(token.text)
+        return self.chars >= _COALESCE_MAX_CHARS
+
+    def flush(self) -> TokenEvent:
+        head = cast(TokenEvent, self.first)
+        merged = TokenEvent.model_construct(
+            id=head.id,
+            conversation_id=head.conversation_id,
+            created_at=head.created_at,
+            text="".join(self.texts),
+            index=self.index,
+        )
+        self.first = None
+        self.texts.clear()
+        self.chars = 0
+        self.index += 1
+        return merged
+
+
+async def _step_ready(
+    step: asyncio.Future[BaseStreamEvent], batch: _TokenBatch, loop: asyncio.AbstractEventLoop
+) -> bool:
+    """Wait for the next upstream event, but only until the pending batch's window closes."""
+    if batch.first is None:
+        return True
+    # Keep waiting on the same step after a timeout; cancelling it would end the upstream
+    done, _ = await asyncio.wait({step}, timeout=batch.deadline - loop.time())
+    return bool(done)
+
+
+async def _coalesce_tokens(
+    events: AsyncGenerator[BaseStreamEvent, None], window_s: float
+) -> AsyncGenerator[BaseStreamEvent, None]:
+    """Merge token events arriving within `window_s` of the first pending one into one TokenEvent.
+
+    Any other event, `_COALESCE_MAX_CHARS` of pending text, the window running out or the end of
+    the stream flushes. Merged events are renumbered so token indexes stay consecutive.
+    """
+    loop = asyncio.get_running_loop()
+    batch = _TokenBatch(window_s)
+    next_event: asyncio.Future[BaseStreamEvent] | None = None
+    try:
+        while True:
+            if next_event is None:
+                next_event = asyncio.ensure_future(anext(events))
+            if not await _step_ready(next_event, batch, loop):
+                yield batch.flush()
+                continue
+            try:
+                event = await next_event
+            except StopAsyncIteration:
+                break
+            finally:
+                next_event = None
+            if type(event) is TokenEvent:
+                if batch.add(cast(TokenEvent, event), loop.time()):
+                    yield batch.flush()
+                continue
+            if batch.first is not None:
+                yield batch.flush()
+            yield event
+        if batch.first is not None:
+            yield batch.flush()
+    finally:
+        if next_event is not None:
+            next_event.cancel()
+            await asyncio.gather(next_event, return_exceptions=True)
+        await events.aclose()
+
+
+_MappedEvent = BaseStreamEvent | list[BaseStreamEvent] | None
+# (conversation_id, sdk_event, event_data, token_index) -> mapped event(s)
+_EventHandler = Callable[[str, Any, Any, int], _MappedEvent]
+
+
+@dataclass(slots=True, frozen=True)
+class _ResponseEventData:
+    """Fields pulled from a `response.tool_call.*` event payload."""
+
+    call_id: str | None
+    name_val: str
+    arguments: Any
+    data_dict: dict[str, Any]
+
+
+@dataclass(slots=True)
+class _TextSink:
+    """Token text buffered for the synthetic output.
+
+    Disabled once the SDK emits its own OutputEvent, which drops the buffer and turns further
+    writes into no-ops.
+    """
+
+    buf: io.StringIO | None = field(default_factory=io.StringIO)
+
+    @property
+    def enabled(self) -> bool:
+        return self.buf is not None
+
+    def write(self, text: str) -> None:
+        if self.buf is not None:
+            self.buf.write(text)
+
+    def disable(self) -> None:
+        self.buf = None
+
+    def getvalue(self) -> str:
+        return self.buf.getvalue() if self.buf is not None else ""
+
+
+_TERMINAL_TOOL_NAMES: frozenset[str] = frozenset(
+    {"terminal_run_tool", "terminal_run", "terminal.run", "terminal.run_tool"}
+)
+
+
+def _parse_preview_args(tool_name: str | None, arguments: Any) -> dict[str, Any] | None:
+    """Return arguments as a dict when previewable; JSON is parsed only for terminal tools."""
+    if isinstance(arguments, dict):
+        return arguments
+    if isinstance(arguments, str) and tool_name in _TERMINAL_TOOL_NAMES:
+        parsed = json.loads(arguments)
+        return parsed if isinstance(parsed, dict) else None
+    return None
+
+
+def _terminal_args_preview(parsed: dict[str, Any]) -> dict[str, Any]:
+    """Pick the terminal command (shortened) and cwd out of parsed arguments."""
+    cmd = parsed.get("command")
+    cwd = parsed.get("cwd")
+    out: dict[str, Any] = {}
+    if isinstance(cmd, str) and cmd:
+        out["command"] = cmd if len(cmd) <= 160 else (cmd[:157] + "...")
+    if isinstance(cwd, str) and cwd:
+        out["cwd"] = cwd
+    return out
+
+
+def _minimal_args_preview(tool_name: str | None, arguments: Any) -> dict[str, Any]:
+    """Build a minimal, safe args preview. For known terminal tools, extract command/cwd."""
+    try:
+        parsed = _parse_preview_args(tool_name, arguments)
+        if parsed is not None:
+            out = _terminal_args_preview(parsed)
+            if out:
+                return out
+        # Fallback for non-terminal or unparsed args
+        if isinstance(arguments, str):
+            return {"len": len(arguments)}
+        if isinstance(arguments, dict):
+            return {"keys": list(arguments.keys())[:5]}
+    except Exception:
+        pass
+    return {}
+
+
+# Synthetic tool call ids: one random prefix per process plus a counter. Unique across workers
+# without asking the OS for randomness on every tool event.
+_TOOL_ID_PREFIX = f"tc_{secrets.token_hex(8)}"
+_tool_id_counter = count()
+
+_perf_counter_ns = time.perf_counter_ns
+_NS_PER_MS = 1_000_000
+
+# Attribute/key names probed, in priority order, for final output text
+_TEXT_KEYS = ("text", "content", "message", "output")
+
+_T = TypeVar("_T")
+
+# One event loop on a daemon thread, shared by every runner in the process. Keeping the loop
+# alive across runs lets the SDK's async HTTP client reuse pooled connections instead of
+# reconnecting for every envelope.
+_loop: asyncio.AbstractEventLoop | None = None
+_loop_thread: threading.Thread | None = None
+_loop_lock = threading.Lock()
+
+
+def _background_loop() -> asyncio.AbstractEventLoop:
+    global _loop, _loop_thread
+    loop = _loop
+    if loop is not None and not loop.is_closed():
+        return loop
+    with _loop_lock:
+        if _loop is None or _loop.is_closed():
+            _loop = asyncio.new_event_loop()
+            _loop_thread = threading.Thread(
+                target=_loop.run_forever, name="magent2-runner-loop", daemon=True
+            )
+            _loop_thread.start()
+            atexit.register(_loop.call_soon_threadsafe, _loop.stop)
+        return _loop
+
+
+def _ensure_off_background_loop() -> None:
+    # Blocking the loop's own thread on a step scheduled onto that loop would never return
+    if threading.current_thread() is _loop_thread:
+        raise RuntimeError(
+            "stream_run cannot be called from the shared runner loop; use astream_run instead"
+        )
+
+
+def _run_on_background_loop(step: Awaitable[_T], ctx: contextvars.Context) -> _T:
+    """Await `step` on the shared loop inside `ctx`, blocking the calling thread."""
+    _ensure_off_background_loop()
+    loop = _background_loop()
+    done: concurrent.futures.Future[_T] = concurrent.futures.Future()
+
+    async def _await_step() -> _T:
+        return await step
+
+    def _settle(task: asyncio.Task[_T]) -> None:
+        if task.cancelled():
+            done.cancel()
+        elif (exc := task.exception()) is not None:
+            done.set_exception(exc)
+        else:
+            done.set_result(task.result())
+
+    def _start() -> None:
+        loop.create_task(_await_step(), context=ctx).add_done_callback(_settle)
+
+    loop.call_soon_threadsafe(_start)
+    return done.result()
 
 
 def _dbg_enabled() -> bool:
@@ -30,8 +463,13 @@ def _dbg_enabled() -> bool:
         return False
 
 
+# Read once at import: the flag is consulted for every streamed event, and call sites guard on it
+# so debug messages and their `extra` dicts are never built when debugging is off.
+_DBG: bool = _dbg_enabled()
+
+
 def _dbg_log(message: str, extra: dict[str, Any] | None = None) -> None:
-    if not _dbg_enabled():
+    if not _DBG:
         return
     try:
         get_json_logger("magent2.runner").info(message, extra=extra or {})
@@ -44,7 +482,8 @@ class OpenAIAgentsRunner:
 
     - Maintains simple LRU of sessions keyed by conversation_id
     - Maps SDK events to v1 stream events (TokenEvent, ToolStepEvent, OutputEvent)
-    - Returns a synchronous iterator suitable for the existing Worker loop
+    - Exposes the mapped stream natively via `astream_run` and as a synchronous iterator
+      (`stream_run`) suitable for the existing Worker loop
 
     Tool lifecycle mapping (Agents SDK specifics):
     - Agents streaming emits `ToolCallItem` (often missing id/name) and later `ToolCallOutputItem`
@@ -56,14 +495,17 @@ class OpenAIAgentsRunner:
         matching ToolStepEvent(success/error) with computed duration and the same id. If no pending
         start exists, we emit a fallback start+success pair at output time to preserve lifecycle.
     - This design keeps the frontend contract simple and consistent despite SDK metadata gaps.
+
+    Events are built with `model_construct`: every field is type-checked while mapping, so
+    pydantic validation is skipped on the per-event path (defaults are still filled in).
     """
 
     def __init__(
         self, agent: Agent, *, session_limit: int = 256, max_turns: int | None = None
     ) -> None:
         self._agent = agent
-        self._sessions: dict[str, Any] = {}
-        self._session_order: deque[str] = deque()
+        # Insertion order doubles as recency order for the session LRU
+        self._sessions: OrderedDict[str, Any] = OrderedDict()
         self._session_limit = max(1, session_limit)
         self._max_turns: int | None = int(max_turns) if max_turns is not None else None
         # Session configuration (single approach: SQLiteSession if available)
@@ -72,6 +514,9 @@ class OpenAIAgentsRunner:
             os.getenv("AGENT_SESSION_PATH") or "./.sessions/agents.db"
         ).strip()
 
+        # Session directories already known to exist; skips the stat on later session misses
+        self._ensured_dirs: set[str] = set()
+
         # Optional persistent sessions (detect availability once)
         self._sqlite_session_cls: Any | None = None
         try:
@@ -80,85 +525,94 @@ class OpenAIAgentsRunner:
             self._sqlite_session_cls = SQLiteSession
         except Exception:
             self._sqlite_session_cls = None
+        # Per-conversation tool state, keyed conversation_id -> call_id; dropped when a run ends.
+        # Each inner map is capped (MAGENT2_TOOL_CACHE_MAX) so calls that never see a result
+        # cannot grow a long run without bound; an evicted call just loses its duration/name.
+        tool_map = partial(_LRUDict, _tool_cache_max())
         # Track tool starts to compute durations when results arrive
-        self._tool_start_ns: dict[tuple[str, str], int] = {}
+        self._tool_start_ns: defaultdict[str, dict[str, int]] = defaultdict(tool_map)
         # Track tool names by call id to backfill names on result events
-        self._tool_name_by_id: dict[tuple[str, str], str] = {}
-        # Pending starts when ToolCallItem lacks an id; keyed by conversation
-        self._pending_tool_starts: dict[str, list[int]] = {}
-        # Best-effort pending tool names captured from ToolCallItem in FIFO order
-        self._pending_tool_names: dict[str, list[str]] = {}
+        self._tool_name_by_id: defaultdict[str, dict[str, str]] = defaultdict(tool_map)
+        # Args previews from response.tool_call.created, reused by the matching completion
+        self._tool_args_by_id: defaultdict[str, dict[str, dict[str, Any]]] = defaultdict(
+            tool_map
+        )
+        # The SDK is trusted to emit its own OutputEvent: no token buffering, no synthetic output
+        self._skip_synth_output = os.getenv("AGENT_SKIP_SYNTH_OUTPUT", "0").strip() == "1"
+        # Window for merging consecutive token deltas into one TokenEvent; 0 disables
+        self._token_coalesce_s = _token_coalesce_s()
+        # Orphan tool results (no prior start) as one "completed" step instead of start+success
+        self._fuse_orphan_steps = os.getenv("MAGENT2_FUSE_ORPHAN_TOOL_STEPS", "0").strip() == "1"
         # FIFO of synthetic tool_call_ids for immediate-start correlation
-        self._pending_tool_ids: dict[str, list[str]] = {}
+        self._pending_tool_ids: dict[str, deque[str]] = {}
+        # SDK event type -> mapper, so dispatch is one dict lookup per streamed event
+        self._ev_handlers: dict[str, _EventHandler] = {
+            "raw_response_event": self._handle_raw_response_event,
+            "run_item_stream_event": self._handle_run_item_stream_event,
+        }
+        for suffix, create in (
+            ("created", self._create_tool_start_event),
+            ("completed", self._create_tool_success_event),
+            ("failed", self._create_tool_error_event),
+            ("error", self._create_tool_error_event),
+        ):
+            self._ev_handlers[f"response.tool_call.{suffix}"] = partial(
+                self._handle_response_tool_event, create
+            )
 
     # ----------------------------
     # Public API (Runner protocol)
     # ----------------------------
     def stream_run(self, envelope: MessageEnvelope) -> Iterable[BaseStreamEvent | dict[str, Any]]:
-        # Bound the queue to guard against unbounded growth if a consumer is slow
-        events_queue: Queue[BaseStreamEvent | dict[str, Any] | None] = Queue(maxsize=1024)
-        sentinel: None = None
-        # Capture run context from the caller thread (Worker) to propagate into our runner thread
-        parent_ctx = get_run_context() or {}
+        """Synchronous view of `astream_run` for the Worker loop.
 
-        def _runner() -> None:
-            try:
-                run_id = str(parent_ctx.get("run_id")) if parent_ctx.get("run_id") else None
-                conv_id = (
-                    str(parent_ctx.get("conversation_id"))
-                    if parent_ctx.get("conversation_id")
-                    else None
-                )
-                agent = str(parent_ctx.get("agent")) if parent_ctx.get("agent") else None
-                if run_id and conv_id:
-                    with use_run_context(run_id, conv_id, agent):
-                        asyncio.run(self._run_streaming(envelope, events_queue))
-                else:
-                    asyncio.run(self._run_streaming(envelope, events_queue))
-            finally:
-                # Signal completion regardless of errors
+        Each event is pulled by stepping the async generator on the process-wide runner loop, so
+        the SDK stream is paced by the consumer with no intermediate queue. All steps share one
+        copy of the caller's context, so the run context set by the Worker is visible to the SDK
+        and tools. Calling it from the runner loop's own thread (e.g. a sync tool starting a
+        nested run) raises RuntimeError instead of deadlocking.
+        """
+        _ensure_off_background_loop()
+        events = self.astream_run(envelope)
+        ctx = contextvars.copy_context()
+        try:
+            while True:
                 try:
-                    events_queue.put_nowait(sentinel)
-                except Full:
-                    # Best-effort: if queue is full, iterator will finish when the queue is drained
-                    pass
-
-        thread = threading.Thread(target=_runner, daemon=True)
-        thread.start()
+                    item = _run_on_background_loop(anext(events), ctx)
+                except StopAsyncIteration:
+                    break
+                except Exception as exc:
+                    # A failed run ends the stream instead of raising into the Worker
+                    self._log_stream_failure(envelope.conversation_id, exc)
+                    break
+                yield item
+        finally:
+            try:
+                _run_on_background_loop(events.aclose(), ctx)
+            except Exception:
+                pass
 
-        # Drain the queue until sentinel is received
-        while True:
-            item = events_queue.get()
-            if item is sentinel:
-                break
-            # mypy: item cannot be None here, guarded by sentinel check
-            assert item is not None
-            yield item
+    async def astream_run(self, envelope: MessageEnvelope) -> AsyncGenerator[BaseStreamEvent, None]:
+        """Stream mapped events for one envelope as a native async iterator."""
+        async with aclosing(self._run_streaming(envelope)) as events:
+            async for event in events:
+                yield event
 
     # ----------------------------
     # Internal helpers
     # ----------------------------
     def _get_session(self, conversation_id: str) -> Any:
-        # Simple LRU: move to end on access, evict from left when over limit
+        # Simple LRU: move to end on access, evict from the front when over limit
         if conversation_id in self._sessions:
-            try:
-                self._session_order.remove(conversation_id)
-            except ValueError:
-                pass
-            self._session_order.append(conversation_id)
+            self._sessions.move_to_end(conversation_id)
             return self._sessions[conversation_id]
 
         # Create a session (SQLite only, fall back to None if unavailable)
         session: Any = self._try_create_sqlite_session(conversation_id)
 
         self._sessions[conversation_id] = session
-        self._session_order.append(conversation_id)
         if len(self._sessions) > self._session_limit:
-            evict_id = self._session_order.popleft()
-            try:
-                del self._sessions[evict_id]
-            except KeyError:
-                pass
+            self._sessions.popitem(last=False)
         return session
 
     # ----------------------------
@@ -177,43 +631,66 @@ class OpenAIAgentsRunner:
         except Exception:
             return None
 
-    @staticmethod
-    def _ensure_dir_for_path(path: str) -> None:
+    def _ensure_dir_for_path(self, path: str) -> None:
+        directory = os.path.dirname(path)
+        if directory in self._ensured_dirs:
+            return
         try:
-            directory = os.path.dirname(path)
             if directory and not os.path.exists(directory):
                 os.makedirs(directory, exist_ok=True)
+            self._ensured_dirs.add(directory)
         except Exception:
             # Best-effort; if directory cannot be created, the session creation will fail gracefully
             pass
 
     async def _run_streaming(
-        self,
-        envelope: MessageEnvelope,
-        queue: Queue[BaseStreamEvent | dict[str, Any] | None],
-    ) -> None:
-        self._debug_run_streaming_start(envelope.conversation_id)
+        self, envelope: MessageEnvelope
+    ) -> AsyncGenerator[BaseStreamEvent, None]:
+        if _DBG:
+            self._debug_run_streaming_start(envelope.conversation_id)
 
         session = self._get_session(envelope.conversation_id)
         result_stream = self._create_result_stream(envelope, session)
 
-        token_index = 0
-        accumulated_text_parts: list[str] = []
-        saw_explicit_output = False
-
-        self._debug_before_event_loop(envelope.conversation_id)
-
-        token_index, saw_explicit_output = await self._process_event_stream(
-            result_stream,
-            envelope.conversation_id,
-            queue,
-            token_index,
-            accumulated_text_parts,
-            saw_explicit_output,
-        )
+        text_sink = _TextSink(None) if self._skip_synth_output else _TextSink()
 
-        if not saw_explicit_output:
-            self._emit_synth_output(queue, envelope.conversation_id, accumulated_text_parts)
+        if _DBG:
+            self._debug_before_event_loop(envelope.conversation_id)
+
+        events = self._process_event_stream(result_stream, envelope.conversation_id, text_sink)
+        if self._token_coalesce_s > 0:
+            events = _coalesce_tokens(events, self._token_coalesce_s)
+        try:
+            async with aclosing(events):
+                async for event in events:
+                    yield event
+
+            # The sink stays enabled only when no explicit output was seen
+            if text_sink.enabled:
+                yield self._synth_output(envelope.conversation_id, text_sink)
+        finally:
+            self._forget_tool_state(envelope.conversation_id)
+
+    def _forget_tool_state(self, conversation_id: str) -> None:
+        """Drop tool correlation state left over from a finished run of this conversation."""
+        self._tool_start_ns.pop(conversation_id, None)
+        self._tool_name_by_id.pop(conversation_id, None)
+        self._tool_args_by_id.pop(conversation_id, None)
+        self._pending_tool_ids.pop(conversation_id, None)
+
+    def _log_stream_failure(self, conversation_id: str, exc: Exception) -> None:
+        try:
+            get_json_logger("magent2.runner").error(
+                "runner stream failed",
+                extra={
+                    "event": "runner_stream_error",
+                    "service": "runner",
+                    "conversation_id": conversation_id,
+                    "error": str(exc)[:200],
+                },
+            )
+        except Exception:
+            pass
 
     def _debug_run_streaming_start(self, conversation_id: str) -> None:
         """Log debug information when run streaming starts."""
@@ -261,27 +738,38 @@ class OpenAIAgentsRunner:
         self,
         result_stream: Any,
         conversation_id: str,
-        queue: Queue[BaseStreamEvent | dict[str, Any] | None],
-        token_index: int,
-        accumulated_text_parts: list[str],
-        saw_explicit_output: bool,
-    ) -> tuple[int, bool]:
-        """Process the async event stream and return updated token_index and saw_output flag."""
-        current_token_index = token_index
-        current_saw_output = saw_explicit_output
+        text_sink: _TextSink,
+    ) -> AsyncGenerator[BaseStreamEvent, None]:
+        """Map the SDK event stream to v1 events, accumulating token text as it goes."""
+        token_index = 0
+        # Bound once: looked up for every streamed event otherwise
+        map_event = self._map_event
+        classify = self._classify_mapped_event
 
         async for ev in result_stream.stream_events():
-            self._debug_sdk_event(ev)
-            mapped = self._try_map_event(conversation_id, ev, current_token_index)
+            if _DBG:
+                self._debug_sdk_event(ev)
+            try:
+                mapped = map_event(conversation_id, ev, token_index)
+            except Exception as exc:
+                # SDK items are arbitrary objects; a bad one must not end the stream
+                if _DBG:
+                    _dbg_log(
+                        f"event mapping failed: {type(exc).__name__}: {exc}",
+                        extra={
+                            "event": "map_event_error",
+                            "service": "runner",
+                            "conversation_id": conversation_id,
+                        },
+                    )
+                continue
             if mapped is None:
                 continue
 
-            inc, saw_output = self._enqueue_mapped_event(queue, mapped, accumulated_text_parts)
-            current_token_index += inc
-            if saw_output:
-                current_saw_output = True
-
-        return current_token_index, current_saw_output
+            inc, events = classify(mapped, text_sink)
+            token_index += inc
+            for event in events:
+                yield event
 
     def _debug_sdk_event(self, ev: Any) -> None:
         """Log SDK event type for observability."""
@@ -301,19 +789,44 @@ class OpenAIAgentsRunner:
 
         Tolerant to either typed objects or dict-shaped events.
         """
-        self._debug_log_event(conversation_id, ev)
-
         ev_type, data = self._extract_event_type_and_data(ev)
+        if _DBG:
+            self._debug_log_event(conversation_id, ev, ev_type, data)
 
-        if ev_type == "raw_response_event":
-            return self._map_raw_response_event(conversation_id, data, token_index)
-        if ev_type == "run_item_stream_event":
-            return self._map_run_item_stream_event_for_item(conversation_id, ev, data)
-        if self._is_response_tool_call_event(ev_type):
-            return self._map_response_tool_event(conversation_id, cast(str, ev_type), data)
-        return None
+        handler = self._ev_handlers.get(ev_type) if isinstance(ev_type, str) else None
+        if handler is None:
+            # Deltas and unknown subtypes are ignored
+            return None
+        return handler(conversation_id, ev, data, token_index)
+
+    def _handle_raw_response_event(
+        self, conversation_id: str, ev: Any, data: Any, token_index: int
+    ) -> _MappedEvent:
+        return self._map_raw_response_event(conversation_id, data, token_index)
 
-    def _debug_log_event(self, conversation_id: str, ev: Any) -> None:
+    def _handle_run_item_stream_event(
+        self, conversation_id: str, ev: Any, data: Any, token_index: int
+    ) -> _MappedEvent:
+        return self._map_run_item_stream_event_for_item(conversation_id, ev, data)
+
+    def _handle_response_tool_event(
+        self,
+        create: Callable[[str, _ResponseEventData], ToolStepEvent],
+        conversation_id: str,
+        ev: Any,
+        data: Any,
+        token_index: int,
+    ) -> ToolStepEvent | None:
+        # Expected shapes from Responses API streaming for tools
+        # created → start; completed → success; failed → error
+        event_data = self._extract_response_event_data(data)
+        if not event_data.name_val:
+            return None
+        return create(conversation_id, event_data)
+
+    def _debug_log_event(
+        self, conversation_id: str, ev: Any, ev_type: str | None, data: Any
+    ) -> None:
         """Log debug information for event processing."""
         _dbg_log(
             "DEBUG: _map_event called",
@@ -324,9 +837,6 @@ class OpenAIAgentsRunner:
             },
         )
 
-        ev_type = getattr(ev, "type", None) or (ev.get("type") if isinstance(ev, dict) else None)
-        data = getattr(ev, "data", None) if not isinstance(ev, dict) else ev.get("data")
-
         msg = (
             f"DEBUG: processing event, ev_type={ev_type}, "
             f"ev_class={type(ev).__name__}, has_data={data is not None}"
@@ -344,18 +854,19 @@ class OpenAIAgentsRunner:
     @staticmethod
     def _extract_event_type_and_data(ev: Any) -> tuple[str | None, Any]:
         """Extract event type and data from event object."""
-        ev_type = getattr(ev, "type", None) or (ev.get("type") if isinstance(ev, dict) else None)
-        data = getattr(ev, "data", None) if not isinstance(ev, dict) else ev.get("data")
-        return ev_type, data
+        if isinstance(ev, dict):
+            return ev.get("type"), ev.get("data")
+        return getattr(ev, "type", None), getattr(ev, "data", None)
 
     def _map_run_item_stream_event_for_item(
         self, conversation_id: str, ev: Any, data: Any
     ) -> BaseStreamEvent | list[BaseStreamEvent] | None:
         """Map run_item_stream_event by extracting the item."""
-        _dbg_log(
-            "routing run_item_stream_event to _map_run_item_stream_event",
-            extra={"event": "run_item_debug", "service": "runner"},
-        )
+        if _DBG:
+            _dbg_log(
+                "routing run_item_stream_event to _map_run_item_stream_event",
+                extra={"event": "run_item_debug", "service": "runner"},
+            )
         # Prefer explicit 'item' attribute per SDK examples; fall back to data
         item = getattr(ev, "item", None)
         if item is None and isinstance(ev, dict):
@@ -364,66 +875,33 @@ class OpenAIAgentsRunner:
             item = data
         return self._map_run_item_stream_event(conversation_id, item)
 
-    @staticmethod
-    def _is_response_tool_call_event(ev_type: str | None) -> bool:
-        """Check if event type is a response tool call event."""
-        return isinstance(ev_type, str) and ev_type.startswith("response.tool_call.")
-
-    def _try_map_event(
-        self, conversation_id: str, ev: Any, token_index: int
-    ) -> BaseStreamEvent | list[BaseStreamEvent] | None:
-        try:
-            return self._map_event(conversation_id, ev, token_index)
-        except Exception:
-            return None
-
-    def _enqueue_mapped_event(
+    def _classify_mapped_event(
         self,
-        queue: Queue[BaseStreamEvent | dict[str, Any] | None],
         mapped: BaseStreamEvent | list[BaseStreamEvent],
-        accumulated_text_parts: list[str],
-    ) -> tuple[int, bool]:
+        text_sink: _TextSink,
+    ) -> tuple[int, list[BaseStreamEvent]]:
+        """Return (token increment, events to yield) for a mapped item."""
         # Handle multiple events emitted for a single SDK item
-        if isinstance(mapped, list):
-            total_inc = 0
-            saw_output_any = False
-            for ev in mapped:
-                inc, saw_output = self._enqueue_mapped_event(queue, ev, accumulated_text_parts)
-                total_inc += inc
-                saw_output_any = saw_output_any or saw_output
-            return total_inc, saw_output_any
-        if isinstance(mapped, TokenEvent):
-            accumulated_text_parts.append(mapped.text)
-            try:
-                queue.put_nowait(mapped)
-            except Full:
-                pass
-            return 1, False
-        if isinstance(mapped, ToolStepEvent):
-            try:
-                queue.put_nowait(mapped)
-            except Full:
-                pass
-            return 0, False
-        if isinstance(mapped, OutputEvent):
-            try:
-                queue.put_nowait(mapped)
-            except Full:
-                pass
-            return 0, True
-        return 0, False
+        candidates = mapped if isinstance(mapped, list) else [mapped]
+        token_inc = 0
+        events: list[BaseStreamEvent] = []
+        for ev in candidates:
+            # Mappers build the concrete event classes, so an identity check on the type is
+            # enough; tokens are by far the most common and are tested first
+            ev_cls = type(ev)
+            if ev_cls is TokenEvent:
+                text_sink.write(cast(TokenEvent, ev).text)
+                token_inc += 1
+            elif ev_cls is OutputEvent:
+                text_sink.disable()
+            elif ev_cls is not ToolStepEvent:
+                continue
+            events.append(ev)
+        return token_inc, events
 
-    def _emit_synth_output(
-        self,
-        queue: Queue[BaseStreamEvent | dict[str, Any] | None],
-        conversation_id: str,
-        accumulated_text_parts: list[str],
-    ) -> None:
-        final_text = "".join(accumulated_text_parts)
-        try:
-            queue.put_nowait(OutputEvent(conversation_id=conversation_id, text=final_text))
-        except Full:
-            pass
+    def _synth_output(self, conversation_id: str, text_sink: _TextSink) -> OutputEvent:
+        final_text = text_sink.getvalue()
+        return OutputEvent.model_construct(conversation_id=conversation_id, text=final_text)
 
     # Note: log emission to stream is intentionally omitted to keep event order stable for tests.
 
@@ -431,18 +909,21 @@ class OpenAIAgentsRunner:
     def _map_raw_response_event(
         conversation_id: str, data: Any, token_index: int
     ) -> TokenEvent | None:
-        if isinstance(data, ResponseTextDeltaEvent):
-            delta = getattr(data, "delta", None)
-            if isinstance(delta, str) and delta:
-                return TokenEvent(conversation_id=conversation_id, text=delta, index=token_index)
+        # Exact type checks first: nearly every raw event is the SDK's own delta class
+        data_cls = type(data)
+        if data_cls is ResponseTextDeltaEvent or isinstance(data, ResponseTextDeltaEvent):
+            delta = data.delta
+        elif data_cls is dict or isinstance(data, dict):
+            delta = data.get("delta")
+        else:
             return None
-        if isinstance(data, dict):
-            delta_val = data.get("delta")
-            if isinstance(delta_val, str) and delta_val:
-                return TokenEvent(
-                    conversation_id=conversation_id, text=delta_val, index=token_index
-                )
-        return None
+        if not (isinstance(delta, str) and delta):
+            return None
+        # Fields are already type-checked above; skip pydantic validation for the most frequent
+        # event in a run. Defaults (id, created_at, event) are still filled in.
+        return TokenEvent.model_construct(
+            conversation_id=conversation_id, text=delta, index=token_index
+        )
 
     def _map_run_item_stream_event(
         self, conversation_id: str, item: Any
@@ -451,9 +932,10 @@ class OpenAIAgentsRunner:
             return None
 
         item_type, name, args, result = self._extract_item_details(item)
-        self._debug_log_item_mapping(item_type, name, args, result)
+        if _DBG:
+            self._debug_log_item_mapping(item_type, name, args, result)
 
-        if not self._is_valid_name(name):
+        if _DBG and not self._is_valid_name(name):
             self._log_tool_name_missing(item)
 
         # Try different mapping strategies in order
@@ -506,7 +988,7 @@ class OpenAIAgentsRunner:
         err = self._extract_error(item)
         if isinstance(err, str) and self._is_valid_name(name):
             call_id = self._get_tool_call_id(item) or self._gen_tool_call_id()
-            return ToolStepEvent(
+            return ToolStepEvent.model_construct(
                 conversation_id=conversation_id,
                 name=name,
                 args={},
@@ -535,120 +1017,74 @@ class OpenAIAgentsRunner:
         except Exception:
             pass
 
-    def _map_response_tool_event(
-        self, conversation_id: str, ev_type: str, data: Any
-    ) -> ToolStepEvent | None:
-        # Expected shapes from Responses API streaming for tools
-        # created → start; completed → success; failed → error
-        event_data = self._extract_response_event_data(data)
-        if not event_data.name_val:
-            return None
-
-        if ev_type.endswith(".created"):
-            return self._create_tool_start_event(conversation_id, event_data)
-        if ev_type.endswith(".completed"):
-            return self._create_tool_success_event(conversation_id, event_data)
-        if ev_type.endswith((".failed", ".error")):
-            return self._create_tool_error_event(conversation_id, event_data)
-
-        # Ignore deltas and unknown subtypes
-        return None
-
     @staticmethod
-    def _extract_response_event_data(data: Any) -> Any:
+    def _extract_response_event_data(data: Any) -> _ResponseEventData:
         """Extract and structure event data for response tool events."""
-        from collections import namedtuple
-
-        ResponseEventData = namedtuple(
-            "ResponseEventData", ["call_id", "name_val", "args_preview", "data_dict"]
-        )
-
         d = data if isinstance(data, dict) else {}
         call_id = d.get("id") if isinstance(d.get("id"), str) else None
-        name_val = d.get("name") if isinstance(d.get("name"), str) else None
-        args_val = d.get("arguments")
-
-        # Build a minimal, safe args preview. For known terminal tools, extract command/cwd.
-        def _minimal_args_preview(tool_name: str | None, arguments: Any) -> dict[str, Any]:
-            try:
-                is_terminal = isinstance(tool_name, str) and tool_name in (
-                    "terminal_run_tool",
-                    "terminal_run",
-                    "terminal.run",
-                    "terminal.run_tool",
-                )
-                parsed: dict[str, Any] | None = None
-                if isinstance(arguments, str):
-                    if is_terminal:
-                        parsed = json.loads(arguments)
-                elif isinstance(arguments, dict):
-                    parsed = arguments
-                if isinstance(parsed, dict):
-                    cmd = parsed.get("command")
-                    cwd = parsed.get("cwd")
-                    out: dict[str, Any] = {}
-                    if isinstance(cmd, str) and cmd:
-                        out["command"] = cmd if len(cmd) <= 160 else (cmd[:157] + "...")
-                    if isinstance(cwd, str) and cwd:
-                        out["cwd"] = cwd
-                    if out:
-                        return out
-                # Fallback for non-terminal or unparsed args
-                if isinstance(arguments, str):
-                    return {"len": len(arguments)}
-                if isinstance(arguments, dict):
-                    try:
-                        return {"keys": list(arguments.keys())[:5]}
-                    except Exception:
-                        return {}
-            except Exception:
-                pass
-            return {}
-
-        args_preview = _minimal_args_preview(name_val, args_val)
-
-        return ResponseEventData(call_id, name_val, args_preview, d)
-
-    def _create_tool_start_event(self, conversation_id: str, event_data: Any) -> ToolStepEvent:
+        name_val = d.get("name") if isinstance(d.get("name"), str) else ""
+        return _ResponseEventData(call_id, name_val, d.get("arguments"), d)
+
+    def _tool_args_preview(
+        self, conversation_id: str, event_data: _ResponseEventData
+    ) -> dict[str, Any]:
+        """Reuse the preview built when the call started; build one only if none was kept."""
+        if event_data.call_id:
+            stored = self._tool_args_by_id[conversation_id].pop(event_data.call_id, None)
+            if stored is not None:
+                return stored
+        return _minimal_args_preview(event_data.name_val, event_data.arguments)
+
+    def _create_tool_start_event(
+        self, conversation_id: str, event_data: _ResponseEventData
+    ) -> ToolStepEvent:
         """Create a tool start event."""
         call_id = event_data.call_id or self._gen_tool_call_id()
-        self._tool_start_ns[(conversation_id, call_id)] = self._now_ns()
-        return ToolStepEvent(
+        self._tool_start_ns[conversation_id][call_id] = self._now_ns()
+        args_preview = _minimal_args_preview(event_data.name_val, event_data.arguments)
+        if event_data.call_id:
+            # Only SDK ids can be matched by the completion event
+            self._tool_args_by_id[conversation_id][call_id] = args_preview
+        return ToolStepEvent.model_construct(
             conversation_id=conversation_id,
             name=event_data.name_val,
-            args=event_data.args_preview,
+            args=args_preview,
             status="start",
             tool_call_id=call_id,
         )
 
-    def _create_tool_success_event(self, conversation_id: str, event_data: Any) -> ToolStepEvent:
+    def _create_tool_success_event(
+        self, conversation_id: str, event_data: _ResponseEventData
+    ) -> ToolStepEvent:
         """Create a tool success event."""
         call_id = event_data.call_id or self._gen_tool_call_id()
-        start_ns = self._tool_start_ns.pop((conversation_id, call_id), None)
+        start_ns = self._tool_start_ns[conversation_id].pop(call_id, None)
         dur_ms: int | None = None
         if isinstance(start_ns, int):
-            dur_ms = int((self._now_ns() - start_ns) / 1_000_000)
+            dur_ms = (self._now_ns() - start_ns) // _NS_PER_MS
         result_val = event_data.data_dict.get("result")
-        return ToolStepEvent(
+        return ToolStepEvent.model_construct(
             conversation_id=conversation_id,
             name=event_data.name_val,
-            args=event_data.args_preview or {},
+            args=self._tool_args_preview(conversation_id, event_data),
             result_summary=self._summarize(result_val) if result_val is not None else None,
             status="success",
             duration_ms=dur_ms,
             tool_call_id=call_id,
         )
 
-    def _create_tool_error_event(self, conversation_id: str, event_data: Any) -> ToolStepEvent:
+    def _create_tool_error_event(
+        self, conversation_id: str, event_data: _ResponseEventData
+    ) -> ToolStepEvent:
         """Create a tool error event."""
         call_id = event_data.call_id or self._gen_tool_call_id()
         err_text = (
             event_data.data_dict.get("error") or event_data.data_dict.get("message") or "tool error"
         )
-        return ToolStepEvent(
+        return ToolStepEvent.model_construct(
             conversation_id=conversation_id,
             name=event_data.name_val,
-            args=event_data.args_preview or {},
+            args=self._tool_args_preview(conversation_id, event_data),
             status="error",
             error=self._summarize(err_text, limit=160),
             tool_call_id=call_id,
@@ -686,12 +1122,18 @@ class OpenAIAgentsRunner:
     def _handle_tool_call(self, conversation_id: str, name: Any, args: Any) -> ToolStepEvent:
         """Handle tool call by emitting start event with synthetic ID."""
         call_id = self._gen_tool_call_id()
-        self._pending_tool_ids.setdefault(conversation_id, []).append(call_id)
-        self._tool_start_ns[(conversation_id, call_id)] = self._now_ns()
+        self._pending_tool_ids.setdefault(conversation_id, deque()).append(call_id)
+        self._tool_start_ns[conversation_id][call_id] = self._now_ns()
         final_name = name if isinstance(name, str) and name else "unknown_tool"
-        self._tool_name_by_id[(conversation_id, call_id)] = final_name
-        normalized_args = self._normalize_args(args) if isinstance(args, dict | list) else {}
-        return ToolStepEvent(
+        self._tool_name_by_id[conversation_id][call_id] = final_name
+        normalized_args: dict[str, Any]
+        if isinstance(args, dict):
+            normalized_args = args
+        elif isinstance(args, list):
+            normalized_args = {"args": args}
+        else:
+            normalized_args = {}
+        return ToolStepEvent.model_construct(
             conversation_id=conversation_id,
             name=final_name,
             args=normalized_args,
@@ -708,7 +1150,7 @@ class OpenAIAgentsRunner:
         if pending_id is None:
             return self._create_fallback_tool_events(conversation_id, name, result, item)
 
-        stored_name = self._tool_name_by_id.get((conversation_id, pending_id))
+        stored_name = self._tool_name_by_id[conversation_id].get(pending_id)
         final_name = name if isinstance(name, str) and name else (stored_name or "unknown_tool")
         return self._build_tool_result_event(
             conversation_id, final_name, result, item, call_id_override=pending_id
@@ -717,8 +1159,8 @@ class OpenAIAgentsRunner:
     def _get_pending_tool_id(self, conversation_id: str) -> str | None:
         """Get the next pending tool ID for correlation."""
         id_list = self._pending_tool_ids.get(conversation_id)
-        if isinstance(id_list, list) and id_list:
-            pending_id = id_list.pop(0)
+        if id_list:
+            pending_id = id_list.popleft()
             if not id_list:
                 self._pending_tool_ids.pop(conversation_id, None)
             return pending_id
@@ -729,11 +1171,21 @@ class OpenAIAgentsRunner:
     ) -> ToolStepEvent | list[ToolStepEvent] | None:
         """Create fallback start+success events when no pending ID exists."""
         fallback_id = self._gen_tool_call_id()
-        self._tool_start_ns[(conversation_id, fallback_id)] = self._now_ns()
         provisional_name = name if isinstance(name, str) and name else "unknown_tool"
-        self._tool_name_by_id[(conversation_id, fallback_id)] = provisional_name
+        if self._fuse_orphan_steps:
+            return ToolStepEvent.model_construct(
+                conversation_id=conversation_id,
+                name=provisional_name,
+                args={},
+                result_summary=self._summarize(result),
+                status="completed",
+                duration_ms=0,
+                tool_call_id=fallback_id,
+            )
+        self._tool_start_ns[conversation_id][fallback_id] = self._now_ns()
+        self._tool_name_by_id[conversation_id][fallback_id] = provisional_name
 
-        start_event = ToolStepEvent(
+        start_event = ToolStepEvent.model_construct(
             conversation_id=conversation_id,
             name=provisional_name,
             args={},
@@ -751,15 +1203,19 @@ class OpenAIAgentsRunner:
 
     @staticmethod
     def _is_tool_call(t: str) -> bool:
+        if t in _TOOL_CALL_TYPES:
+            return True
+        if t in _TOOL_RESULT_TYPES:
+            return False
         return ("tool_call" in t) and ("output" not in t)
 
     @staticmethod
     def _is_tool_result(t: str) -> bool:
-        return (
-            ("tool_call_output" in t)
-            or ("tool" in t and "output" in t)
-            or ("tool_call_output_item" in t)
-        )
+        if t in _TOOL_RESULT_TYPES:
+            return True
+        if t in _TOOL_CALL_TYPES:
+            return False
+        return "tool" in t and "output" in t
 
     def _build_tool_call_event(
         self, conversation_id: str, name: Any, args: Any, item: Any
@@ -767,13 +1223,19 @@ class OpenAIAgentsRunner:
         if not (isinstance(name, str) and name):
             # Fallback: emit with generic tool name to preserve lifecycle visibility
             name = "unknown_tool"
-        normalized_args = self._normalize_args(args) if isinstance(args, dict | list) else {}
+        normalized_args: dict[str, Any]
+        if isinstance(args, dict):
+            normalized_args = args
+        elif isinstance(args, list):
+            normalized_args = {"args": args}
+        else:
+            normalized_args = {}
         call_id = self._get_tool_call_id(item) or self._gen_tool_call_id()
-        self._tool_start_ns[(conversation_id, call_id)] = self._now_ns()
+        self._tool_start_ns[conversation_id][call_id] = self._now_ns()
         # Remember tool name for backfilling on success
         if isinstance(name, str) and name:
-            self._tool_name_by_id[(conversation_id, call_id)] = name
-        return ToolStepEvent(
+            self._tool_name_by_id[conversation_id][call_id] = name
+        return ToolStepEvent.model_construct(
             conversation_id=conversation_id,
             name=name,
             args=normalized_args,
@@ -791,25 +1253,17 @@ class OpenAIAgentsRunner:
         call_id_override: str | None = None,
     ) -> ToolStepEvent | None:
         call_id = call_id_override or self._get_tool_call_id(item) or self._gen_tool_call_id()
-        # If name missing, backfill from prior start event
-        final_name = (
-            name
-            if isinstance(name, str) and name
-            else self._tool_name_by_id.get((conversation_id, call_id))
-        )
+        # If name missing, backfill from prior start event; the mapping is done with either way
+        stored_name = self._tool_name_by_id[conversation_id].pop(call_id, None)
+        final_name = name if isinstance(name, str) and name else stored_name
         if not (isinstance(final_name, str) and final_name):
             final_name = "unknown_tool"
         summary = self._summarize(result)
         dur_ms: int | None = None
-        start_ns = self._tool_start_ns.pop((conversation_id, call_id), None)
+        start_ns = self._tool_start_ns[conversation_id].pop(call_id, None)
         if isinstance(start_ns, int):
-            dur_ms = int((self._now_ns() - start_ns) / 1_000_000)
-        # Cleanup backfilled name mapping after success
-        try:
-            self._tool_name_by_id.pop((conversation_id, call_id), None)
-        except Exception:
-            pass
-        return ToolStepEvent(
+            dur_ms = (self._now_ns() - start_ns) // _NS_PER_MS
+        return ToolStepEvent.model_construct(
             conversation_id=conversation_id,
             name=final_name,
             args={},
@@ -822,10 +1276,10 @@ class OpenAIAgentsRunner:
     @staticmethod
     def _map_tool_invocation(conversation_id: str, name: Any, args: Any) -> ToolStepEvent | None:
         if isinstance(name, str) and name and isinstance(args, dict | list):
-            return ToolStepEvent(
+            return ToolStepEvent.model_construct(
                 conversation_id=conversation_id,
                 name=name,
-                args=OpenAIAgentsRunner._normalize_args(args),
+                args=args if isinstance(args, dict) else {"args": args},
                 status="start",
                 tool_call_id=OpenAIAgentsRunner._gen_tool_call_id(),
             )
@@ -834,7 +1288,7 @@ class OpenAIAgentsRunner:
     @staticmethod
     def _map_tool_result(conversation_id: str, name: Any, result: Any) -> ToolStepEvent | None:
         if isinstance(name, str) and name and result is not None:
-            return ToolStepEvent(
+            return ToolStepEvent.model_construct(
                 conversation_id=conversation_id,
                 name=name,
                 args={},
@@ -849,7 +1303,7 @@ class OpenAIAgentsRunner:
             return None
         text_value = self._extract_text(item)
         if isinstance(text_value, str) and text_value:
-            return OutputEvent(
+            return OutputEvent.model_construct(
                 conversation_id=conversation_id,
                 text=text_value,
                 usage=self._extract_usage(item),
@@ -858,208 +1312,59 @@ class OpenAIAgentsRunner:
 
     @staticmethod
     def _parse_name_args_result(item: Any) -> tuple[Any, Any, Any]:
+        fast = _FAST_EXTRACTORS.get(type(item).__name__)
+        if fast is not None:
+            try:
+                parsed = fast(item)
+            except AttributeError:
+                parsed = None
+            if parsed is not None:
+                return parsed
+        sources = _ItemSources.of(item)
         return (
-            OpenAIAgentsRunner._get_name(item),
-            OpenAIAgentsRunner._get_args(item),
-            OpenAIAgentsRunner._get_result(item),
+            sources.first(_NAME_SPEC, _is_nonempty_str),
+            sources.first(_ARGS_SPEC, _is_not_none),
+            sources.first(_RESULT_SPEC, _is_not_none),
         )
 
     @staticmethod
     def _get_name(item: Any) -> Any:
-        # Direct attributes
-        name = getattr(item, "name", None)
-        if isinstance(name, str) and name:
-            return name
-
-        # Check nested tool object
-        tool_obj = getattr(item, "tool", None)
-        if tool_obj is not None:
-            tname = getattr(tool_obj, "name", None)
-            if isinstance(tname, str) and tname:
-                return tname
-
-        # Alternative attributes
-        alt = getattr(item, "tool_name", None) or getattr(item, "tool", None)
-        if isinstance(alt, str) and alt:
-            return alt
-
-        # Raw payload extraction
-        return OpenAIAgentsRunner._extract_name_from_raw(item)
-
-    @staticmethod
-    def _extract_name_from_raw(item: Any) -> Any:
-        # Check raw payload first
-        raw = getattr(item, "raw_item", None)
-        if raw is not None:
-            name = OpenAIAgentsRunner._get_name_from_raw_payload(raw)
-            if name is not None:
-                return name
-
-        # Fall back to dict-shaped items
-        return OpenAIAgentsRunner._get_name_from_dict(item)
-
-    @staticmethod
-    def _get_name_from_raw_payload(raw: Any) -> str | None:
-        """Extract name from raw payload (Pydantic or dict)."""
-        # Pydantic model attributes
-        rname = getattr(raw, "name", None)
-        if isinstance(rname, str) and rname:
-            return rname
-
-        # Dict-like access
-        if isinstance(raw, dict):
-            return OpenAIAgentsRunner._find_first_valid_string(raw, ("name", "tool_name", "tool"))
-        return None
-
-    @staticmethod
-    def _get_name_from_dict(item: Any) -> str | None:
-        """Extract name from dict-shaped items."""
-        if isinstance(item, dict):
-            return OpenAIAgentsRunner._find_first_valid_string(item, ("name", "tool_name", "tool"))
-        return None
-
-    @staticmethod
-    def _find_first_valid_string(data: dict, keys: tuple[str, ...]) -> str | None:
-        """Find first valid string value from dict using given keys."""
-        for key in keys:
-            value = data.get(key)
-            if isinstance(value, str) and value:
-                return value
-        return None
+        return _ItemSources.of(item).first(_NAME_SPEC, _is_nonempty_str)
 
     @staticmethod
     def _get_args(item: Any) -> Any:
-        # Direct attributes
-        args = getattr(item, "arguments", None)
-        if args is not None:
-            return args
-
-        # Check nested tool object
-        tool_obj = getattr(item, "tool", None)
-        if tool_obj is not None:
-            targs = getattr(tool_obj, "arguments", None) or getattr(tool_obj, "input", None)
-            if targs is not None:
-                return targs
-
-        # Raw payload extraction
-        return OpenAIAgentsRunner._extract_args_from_raw(item)
-
-    @staticmethod
-    def _extract_args_from_raw(item: Any) -> Any:
-        # Raw payload embedded on typed items
-        raw = getattr(item, "raw_item", None)
-        if raw is not None:
-            # Pydantic model attributes (e.g., ResponseFunctionToolCall.arguments)
-            rargs = getattr(raw, "arguments", None)
-            if rargs is not None:
-                return rargs
-            if isinstance(raw, dict):
-                for key in ("arguments", "args", "input", "parameters"):
-                    v = raw.get(key)
-                    if v is not None:
-                        return v
-        # Dict-shaped items
-        if isinstance(item, dict):
-            return (
-                item.get("arguments")
-                or item.get("args")
-                or item.get("input")
-                or item.get("parameters")
-            )
-        return None
+        return _ItemSources.of(item).first(_ARGS_SPEC, _is_not_none)
 
     @staticmethod
     def _get_result(item: Any) -> Any:
-        # Direct attributes
-        result = getattr(item, "result", None)
-        if result is not None:
-            return result
-
-        # Alternative attributes
-        alt = getattr(item, "output", None) or getattr(item, "content", None)
-        if alt is not None:
-            return alt
-
-        # Raw payload extraction
-        return OpenAIAgentsRunner._extract_result_from_raw(item)
-
-    @staticmethod
-    def _extract_result_from_raw(item: Any) -> Any:
-        # Check raw payload first
-        raw = getattr(item, "raw_item", None)
-        if raw is not None:
-            result = OpenAIAgentsRunner._get_result_from_raw_payload(raw)
-            if result is not None:
-                return result
-
-        # Fall back to dict-shaped items
-        return OpenAIAgentsRunner._get_result_from_dict(item)
-
-    @staticmethod
-    def _get_result_from_raw_payload(raw: Any) -> Any:
-        """Extract result from raw payload (Pydantic or dict)."""
-        result_keys = ("result", "output_text", "output", "content", "tool_result")
-
-        # Pydantic model attributes
-        for attr in result_keys:
-            value = getattr(raw, attr, None)
-            if value is not None:
-                return value
-
-        # Dict-like access
-        if isinstance(raw, dict):
-            return OpenAIAgentsRunner._find_first_non_none(raw, result_keys)
-        return None
-
-    @staticmethod
-    def _get_result_from_dict(item: Any) -> Any:
-        """Extract result from dict-shaped items."""
-        if isinstance(item, dict):
-            result_keys = ("result", "output_text", "output", "content", "tool_result")
-            return OpenAIAgentsRunner._find_first_non_none(item, result_keys)
-        return None
-
-    @staticmethod
-    def _find_first_non_none(data: dict, keys: tuple[str, ...]) -> Any:
-        """Find first non-None value from dict using given keys."""
-        for key in keys:
-            value = data.get(key)
-            if value is not None:
-                return value
-        return None
-
-    @staticmethod
-    def _normalize_args(args: dict[str, Any] | list[Any]) -> dict[str, Any]:
-        if isinstance(args, dict):
-            return args
-        return {"args": args}
+        return _ItemSources.of(item).first(_RESULT_SPEC, _is_not_none)
 
     @staticmethod
     def _is_final_item(item: Any) -> bool:
-        # Attribute flags
-        for flag_attr in ("final", "is_final", "completed"):
-            if getattr(item, flag_attr, False):
-                return True
-        # Dict flags
         if isinstance(item, dict):
-            if any(
-                item.get(k) in (True, "completed", "done", "final")
-                for k in ("final", "is_final", "completed", "status")
-            ):
+            if _dict_marks_final(item):
                 return True
-            kind = item.get("kind") or item.get("type") or ""
-            if isinstance(kind, str) and "completed" in kind:
+            if type(item) is dict:
+                # Plain dicts carry no attribute flags
+                return False
+        # Attribute flags
+        for flag_attr in _FINAL_FLAG_ATTRS:
+            if getattr(item, flag_attr, False):
                 return True
         return False
 
     @staticmethod
     def _summarize(value: Any, *, limit: int = 200) -> str:
         # No truncation; encode structured results as JSON for stable frontend rendering
-        try:
-            if isinstance(value, dict | list):
+        if type(value) is str:
+            # Most tool results are already text: hand back the same object, no copy
+            return value
+        if isinstance(value, dict | list):
+            try:
                 return json.dumps(value, ensure_ascii=False)
-        except Exception:
-            pass
+            except (TypeError, ValueError):
+                # Not JSON-encodable (unsupported types, circular references)
+                pass
         return str(value)
 
     @staticmethod
@@ -1073,7 +1378,7 @@ class OpenAIAgentsRunner:
 
     @staticmethod
     def _extract_text_from_attrs(item: Any) -> str | None:
-        for attr in ("text", "content", "message", "output"):
+        for attr in _TEXT_KEYS:
             val = getattr(item, attr, None)
             if isinstance(val, str) and val:
                 return val
@@ -1081,19 +1386,19 @@ class OpenAIAgentsRunner:
 
     @staticmethod
     def _extract_text_from_dict(dct: dict[str, Any]) -> str | None:
-        # Fast-path direct string values
-        for key in ("text", "content", "message", "output"):
+        # One pass: a direct string wins in key order; otherwise the first list that yields
+        # string-like parts is concatenated
+        joined: str | None = None
+        for key in _TEXT_KEYS:
             val = dct.get(key)
-            if isinstance(val, str) and val:
-                return val
-        # Handle list values by concatenating string-like parts
-        for key in ("text", "content", "message", "output"):
-            val = dct.get(key)
-            if isinstance(val, list):
+            if isinstance(val, str):
+                if val:
+                    return val
+            elif joined is None and isinstance(val, list):
                 parts = OpenAIAgentsRunner._collect_string_parts(val)
                 if parts:
-                    return "".join(parts)
-        return None
+                    joined = "".join(parts)
+        return joined
 
     @staticmethod
     def _collect_string_parts(items: list[Any]) -> list[str]:
@@ -1122,51 +1427,7 @@ class OpenAIAgentsRunner:
     def _get_tool_call_id(item: Any | None) -> str | None:
         if item is None:
             return None
-
-        # Check direct attributes in priority order
-        for attr in ("id", "tool_call_id", "call_id"):
-            val = getattr(item, attr, None)
-            if isinstance(val, str) and val:
-                return val
-
-        # Raw payload extraction
-        return OpenAIAgentsRunner._extract_tool_call_id_from_raw(item)
-
-    @staticmethod
-    def _extract_tool_call_id_from_raw(item: Any) -> str | None:
-        # Check raw payload first
-        raw = getattr(item, "raw_item", None)
-        if raw is not None:
-            tool_call_id = OpenAIAgentsRunner._get_tool_call_id_from_raw_payload(raw)
-            if tool_call_id is not None:
-                return tool_call_id
-
-        # Fall back to dict-shaped items
-        return OpenAIAgentsRunner._get_tool_call_id_from_dict(item)
-
-    @staticmethod
-    def _get_tool_call_id_from_raw_payload(raw: Any) -> str | None:
-        """Extract tool call ID from raw payload (Pydantic or dict)."""
-        id_keys = ("id", "tool_call_id", "call_id")
-
-        # Pydantic model attributes
-        for attr in id_keys:
-            value = getattr(raw, attr, None)
-            if isinstance(value, str) and value:
-                return value
-
-        # Dict-like access
-        if isinstance(raw, dict):
-            return OpenAIAgentsRunner._find_first_valid_string(raw, id_keys)
-        return None
-
-    @staticmethod
-    def _get_tool_call_id_from_dict(item: Any) -> str | None:
-        """Extract tool call ID from dict-shaped items."""
-        if isinstance(item, dict):
-            id_keys = ("id", "tool_call_id", "call_id")
-            return OpenAIAgentsRunner._find_first_valid_string(item, id_keys)
-        return None
+        return cast(str | None, _ItemSources.of(item).first(_CALL_ID_SPEC, _is_nonempty_str))
 
     @staticmethod
     def _extract_error(item: Any) -> str | None:
@@ -1181,15 +1442,11 @@ class OpenAIAgentsRunner:
 
     @staticmethod
     def _gen_tool_call_id() -> str:
-        import uuid
-
-        return f"tc_{uuid.uuid4().hex}"
+        return f"{_TOOL_ID_PREFIX}{next(_tool_id_counter):016x}"
 
     @staticmethod
     def _now_ns() -> int:
-        import time
-
-        return time.perf_counter_ns()
+        return _perf_counter_ns()
 
 
 __all__ = ["OpenAIAgentsRunner"]
@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import re
 import subprocess
+from collections.abc import Iterable
 from dataclasses import dataclass
 from pathlib import Path
 
@@ -10,20 +11,37 @@ class BranchError(RuntimeError):
     pass
 
 
-def _run(cmd: list[str], cwd: str | None = None, timeout: float = 5.0) -> tuple[int, str, str]:
-    proc = subprocess.Popen(cmd, cwd=cwd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+def _run(
+    cmd: list[str], cwd: str | None = None, timeout: float = 5.0, input: str | None = None
+) -> tuple[int, str, str]:
+    proc = subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdin=subprocess.PIPE if input is not None else None,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
     try:
-        out, err = proc.communicate(timeout=timeout)
+        out, err = proc.communicate(input=input, timeout=timeout)
     except Exception:
         proc.kill()
         out, err = proc.communicate()
     return proc.returncode, out, err
 
 
-def _ensure_git_repo(root: Path) -> None:
-    code, _, _ = _run(["git", "rev-parse", "--is-inside-work-tree"], cwd=str(root))
-    if code != 0:
-        raise BranchError(f"not a git repository: {root}")
+def _branch_exists(root: Path, name: str) -> bool:
+    # One process both checks the repository and looks up the branch: rev-parse exits 0/1 for
+    # an existing/missing ref and 128 when root is not inside a git repository
+    code, _, _ = _run(
+        ["git", "rev-parse", "--is-inside-work-tree", "--verify", "--quiet", f"refs/heads/{name}"],
+        cwd=str(root),
+    )
+    if code == 0:
+        return True
+    if code == 1:
+        return False
+    raise BranchError(f"not a git repository: {root}")
 
 
 def _sanitize_name(name: str) -> str:
@@ -37,6 +55,10 @@ class Branch:
     name: str
 
 
+def _branch_name(agent_name: str, ticket: str | None) -> str:
+    return f"feature/{_sanitize_name(ticket or 'task')}/{_sanitize_name(agent_name)}"
+
+
 def allocate_branch(*, repo_root: str, agent_name: str, ticket: str | None = None) -> Branch:
     """Create or switch to a normal branch for an agent on the main worktree.
 
@@ -44,15 +66,10 @@ def allocate_branch(*, repo_root: str, agent_name: str, ticket: str | None = Non
     The branch is created from the current HEAD if it does not exist.
     """
     root = Path(repo_root).resolve()
-    _ensure_git_repo(root)
-
-    ticket_part = _sanitize_name(ticket or "task")
-    agent_part = _sanitize_name(agent_name)
-    name = f"feature/{ticket_part}/{agent_part}"
+    name = _branch_name(agent_name, ticket)
 
     # If branch exists, just checkout; otherwise create it
-    code, _, _ = _run(["git", "rev-parse", "--verify", name], cwd=str(root))
-    if code == 0:
+    if _branch_exists(root, name):
         code, _, err = _run(["git", "checkout", name], cwd=str(root))
         if code != 0:
             raise BranchError(f"failed to checkout {name}: {err.strip()}")
@@ -63,4 +80,36 @@ def allocate_branch(*, repo_root: str, agent_name: str, ticket: str | None = Non
     return Branch(name=name)
 
 
-__all__ = ["Branch", "BranchError", "allocate_branch"]
+def allocate_branches_batch(
+    *, repo_root: str, specs: Iterable[tuple[str, str | None]]
+) -> list[Branch]:
+    """Ensure a branch exists for each (agent_name, ticket) pair without switching HEAD.
+
+    Uses the same naming as `allocate_branch`. Existing branches are listed with one
+    `git for-each-ref` and all missing ones are created at the current HEAD in a single
+    `git update-ref --stdin` transaction, so bootstrapping N agents costs a constant number
+    of git processes. Returns one Branch per spec, in order.
+    """
+    root = Path(repo_root).resolve()
+    names = [_branch_name(agent_name, ticket) for agent_name, ticket in specs]
+
+    code, out, _ = _run(
+        ["git", "for-each-ref", "--format=%(refname)", "refs/heads/feature/"], cwd=str(root)
+    )
+    if code != 0:
+        raise BranchError(f"not a git repository: {root}")
+    existing = set(out.splitlines())
+    missing = [n for n in dict.fromkeys(names) if f"refs/heads/{n}" not in existing]
+
+    if missing:
+        code, head, err = _run(["git", "rev-parse", "--verify", "HEAD"], cwd=str(root))
+        if code != 0:
+            raise BranchError(f"cannot resolve HEAD: {err.strip()}")
+        commands = "".join(f"create refs/heads/{n} {head.strip()}\n" for n in missing)
+        code, _, err = _run(["git", "update-ref", "--stdin"], cwd=str(root), input=commands)
+        if code != 0:
+            raise BranchError(f"failed to create branches {missing}: {err.strip()}")
+    return [Branch(name=n) for n in names]
+
+
+__all__ = ["Branch", "BranchError", "allocate_branch", "allocate_branches_batch"]
@@ -2,6 +2,8 @@ from __future__ import annotations
 
 import fnmatch
 import os
+import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
 
 
@@ -10,6 +12,8 @@ class AgentRecord:
     agent_name: str
     team_name: str
     responsibilities: list[str] = field(default_factory=list)
+    # Normalized by the registry APIs; change through TeamRegistry.update_agent so ownership
+    # lookups see the new paths
     allowed_paths: list[str] = field(default_factory=list)
 
 
@@ -26,6 +30,12 @@ class TeamRegistry:
     def __init__(self) -> None:
         self._window_person_by_team: dict[str, str] = {}
         self._agents_by_name: dict[str, AgentRecord] = {}
+        # (pattern length, compiled matcher) per allowed path, by agent name; rebuilt whenever
+        # the registry sets an agent's allowed_paths so lookups never re-translate globs
+        self._compiled_by_agent: dict[str, list[tuple[int, re.Pattern[str]]]] = {}
+        # find_owner_for_path results by normalized path; cleared whenever agents or their
+        # allowed paths change
+        self._owner_cache: OrderedDict[str, AgentRecord | None] = OrderedDict()
 
     # ----------------------------
     # Team/window person
@@ -54,6 +64,8 @@ class TeamRegistry:
             allowed_paths=[_normalize_path(p) for p in (allowed_paths or [])],
         )
         self._agents_by_name[agent_name] = record
+        self._compiled_by_agent[agent_name] = _compile_patterns(record.allowed_paths)
+        self._owner_cache.clear()
         return record
 
     def update_agent(
@@ -68,6 +80,8 @@ class TeamRegistry:
             record.responsibilities = list(responsibilities)
         if allowed_paths is not None:
             record.allowed_paths = [_normalize_path(p) for p in allowed_paths]
+            self._compiled_by_agent[agent_name] = _compile_patterns(record.allowed_paths)
+            self._owner_cache.clear()
         return record
 
     def get_agent(self, agent_name: str) -> AgentRecord | None:
@@ -89,11 +103,23 @@ class TeamRegistry:
         - If tie, return one deterministically by agent_name ordering
         """
         target = _normalize_path(path)
+        cache = self._owner_cache
+        if target in cache:
+            cache.move_to_end(target)
+            return cache[target]
+        owner = self._find_owner_uncached(target)
+        cache[target] = owner
+        if len(cache) > _OWNER_CACHE_MAX:
+            cache.popitem(last=False)
+        return owner
+
+    def _find_owner_uncached(self, target: str) -> AgentRecord | None:
         matches: list[tuple[int, AgentRecord]] = []
-        for record in self._agents_by_name.values():
-            for pat in record.allowed_paths:
-                if _glob_match(target, pat):
-                    matches.append((len(pat), record))
+        subject = os.path.normcase(target)
+        for name, record in self._agents_by_name.items():
+            for length, rx in self._compiled_by_agent[name]:
+                if rx.match(subject):
+                    matches.append((length, record))
         if not matches:
             return None
         # Sort by pattern length desc, then by agent_name for deterministic tie-break
@@ -110,6 +136,8 @@ class TeamRegistry:
         return rec
 
 
+_OWNER_CACHE_MAX = 4096
+
 _REGISTRY_SINGLETON: TeamRegistry | None = None
 
 
@@ -131,18 +159,15 @@ def reset_registry_for_testing() -> None:
 
 
 def _normalize_path(p: str) -> str:
-    # Normalize to forward slashes and remove leading './'
+    # Normalize to forward slashes and remove leading './' segments; idempotent, so paths and
+    # patterns normalized once never need it again
     s = p.replace("\\", "/").strip()
-    if s.startswith("./"):
+    while s.startswith("./"):
         s = s[2:]
     return s
 
 
-def _glob_match(path: str, pattern: str) -> bool:
-    # Support simple ** and * patterns via fnmatch with forward slashes
-    # Ensure both are normalized
-    p = _normalize_path(path)
-    pat = _normalize_path(pattern)
+def _glob_candidates(pat: str) -> list[str]:
     # Make "dir" pattern match "dir/**"
     candidates: list[str] = [pat]
     if not any(ch in pat for ch in ["*", "?", "["]):
@@ -150,7 +175,19 @@ def _glob_match(path: str, pattern: str) -> bool:
             candidates.append(pat + "/**")
         else:
             candidates.append(pat + "**")
-    return any(fnmatch.fnmatch(p, c) for c in candidates)
+    return candidates
+
+
+def _compile_patterns(patterns: list[str]) -> list[tuple[int, re.Pattern[str]]]:
+    # One regex per pattern, already normalized by the registry: its glob candidates joined as
+    # alternatives. Patterns and paths go through os.path.normcase, as fnmatch.fnmatch does, so
+    # matching is unchanged.
+    compiled: list[tuple[int, re.Pattern[str]]] = []
+    for pat in patterns:
+        candidates = _glob_candidates(pat)
+        alternatives = "|".join(fnmatch.translate(os.path.normcase(c)) for c in candidates)
+        compiled.append((len(pat), re.compile(alternatives)))
+    return compiled
 
 
 __all__ = [
@@ -406,7 +406,7 @@ def terminal_run(command: str, cwd: str | None = None) -> str:
             },
         )
         _metrics_increment(metrics, "tool_errors", ctx)
-        return "ok=false exit=None timeout=false truncated=false\nerror:\n" + concise_err
+        return f"ok=false exit=None timeout=false truncated=false\nerror:\n{concise_err}"
 
 
 __all__ = [
@@ -2,13 +2,21 @@ from __future__ import annotations
 
 import os
 import re
+import selectors
 import shlex
 import signal
 import time
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from pathlib import Path
 from subprocess import DEVNULL, PIPE, Popen, TimeoutExpired
-from typing import Any
+from typing import IO, Any
+
+# Read size for draining subprocess pipes incrementally
+_READ_CHUNK_BYTES = 4096
+# Extra bytes retained beyond the output cap so redaction sees whole tokens at the edge
+_REDACTION_SLACK_BYTES = 1024
+# Grace period for draining pipes after a timed-out process group was killed
+_KILL_DRAIN_SECONDS = 1.0
 
 
 def _truncate_to_bytes(text: str, limit_bytes: int) -> tuple[str, bool]:
@@ -19,6 +27,32 @@ def _truncate_to_bytes(text: str, limit_bytes: int) -> tuple[str, bool]:
     return truncated.decode("utf-8", errors="ignore"), True
 
 
+def _decode_output(data: bytes | bytearray) -> str:
+    # Mirror text-mode Popen: decode and translate universal newlines
+    text = bytes(data).decode("utf-8", errors="replace")
+    return text.replace("\r\n", "\n").replace("\r", "\n")
+
+
+def _iter_pipe_chunks(pipes: list[IO[bytes]], deadline: float) -> Iterator[tuple[int, bytes]]:
+    """Yield (fd, chunk) pairs from pipes as data arrives until all reach EOF.
+
+    Raises TimeoutExpired once the monotonic deadline passes.
+    """
+    with selectors.DefaultSelector() as sel:
+        for pipe in pipes:
+            sel.register(pipe, selectors.EVENT_READ)
+        while sel.get_map():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise TimeoutExpired(cmd="", timeout=0)
+            for key, _ in sel.select(remaining):
+                chunk = os.read(key.fd, _READ_CHUNK_BYTES)
+                if not chunk:
+                    sel.unregister(key.fileobj)
+                    continue
+                yield key.fd, chunk
+
+
 class TerminalTool:
     """Safe terminal execution tool with allowlist, timeout, and output caps.
 
@@ -127,34 +161,79 @@ class TerminalTool:
             return f"{stdout}{stderr}"
         return f"{stdout}\n{stderr}"
 
-    def _execute_command(
-        self, argv: list[str], working_dir: str | None, env: dict[str, str]
-    ) -> tuple[str, str, int, bool, int]:
-        start = time.monotonic()
-        proc = Popen(
+    def _spawn(self, argv: list[str], working_dir: str | None, env: dict[str, str]) -> Popen[bytes]:
+        return Popen(
             argv,
             stdin=DEVNULL,
             stdout=PIPE,
             stderr=PIPE,
             cwd=working_dir,
             env=env,
-            text=True,
             start_new_session=True,
         )
+
+    @staticmethod
+    def _kill_group(proc: Popen[bytes]) -> None:
+        try:
+            # Terminate whole process group
+            os.killpg(proc.pid, signal.SIGKILL)
+        except Exception:
+            proc.kill()
+
+    def _execute_command(
+        self, argv: list[str], working_dir: str | None, env: dict[str, str]
+    ) -> tuple[str, str, int, bool, int, bool]:
+        """Run argv, draining output incrementally while retaining a bounded prefix.
+
+        Only the first `output_cap_bytes` (plus a small redaction slack) of each stream are
+        kept in memory; the rest is read and discarded so the child never blocks on a full pipe.
+        """
+        start = time.monotonic()
+        proc = self._spawn(argv, working_dir, env)
+        assert proc.stdout is not None and proc.stderr is not None
+        pipes: list[IO[bytes]] = [proc.stdout, proc.stderr]
+        limit = self.output_cap_bytes + _REDACTION_SLACK_BYTES
+        stdout_buf = bytearray()
+        stderr_buf = bytearray()
+        buffers = {proc.stdout.fileno(): stdout_buf, proc.stderr.fileno(): stderr_buf}
+        overflowed = False
         timeout = False
+
+        def _drain(deadline: float) -> None:
+            nonlocal overflowed
+            for fd, chunk in _iter_pipe_chunks(pipes, deadline):
+                buf = buffers[fd]
+                room = limit - len(buf)
+                if room > 0:
+                    buf += chunk[:room]
+                if len(chunk) > room:
+                    overflowed = True
+
+        deadline = start + self.timeout_seconds
         try:
-            stdout, stderr = proc.communicate(timeout=self.timeout_seconds)
+            _drain(deadline)
+            proc.wait(timeout=max(0.0, deadline - time.monotonic()))
         except TimeoutExpired:
             timeout = True
+            self._kill_group(proc)
             try:
-                # Terminate whole process group
-                os.killpg(proc.pid, signal.SIGKILL)
-            except Exception:
-                proc.kill()
-            stdout, stderr = proc.communicate()
+                _drain(time.monotonic() + _KILL_DRAIN_SECONDS)
+            except TimeoutExpired:
+                pass
+            proc.wait()
+        finally:
+            for pipe in pipes:
+                pipe.close()
 
         duration_ms = int((time.monotonic() - start) * 1000)
-        return stdout or "", stderr or "", proc.returncode, timeout, duration_ms
+        return (
+            _decode_output(stdout_buf),
+            _decode_output(stderr_buf),
+            proc.returncode,
+            timeout,
+            duration_ms,
+            overflowed,
+        )
 
     @staticmethod
     def _redact_output(text: str, patterns: Iterable[re.Pattern[str]] | None = None) -> str:
@@ -185,7 +264,7 @@ class TerminalTool:
         # Build argv for Popen without invoking a shell
         argv = shlex.split(command)
 
-        stdout, stderr, exit_code, did_timeout, duration_ms = self._execute_command(
+        stdout, stderr, exit_code, did_timeout, duration_ms, overflowed = self._execute_command(
             argv, working_dir, env
         )
 
@@ -193,6 +272,7 @@ class TerminalTool:
         # Redact sensitive tokens prior to truncation
         redacted = self._redact_output(combined)
         out_text, was_truncated = _truncate_to_bytes(redacted, self.output_cap_bytes)
+        was_truncated = was_truncated or overflowed
 
         result: dict[str, Any] = {
             "ok": (exit_code == 0) and not did_timeout,
@@ -5,7 +5,7 @@ from pathlib import Path
 
 import pytest
 
-from magent2.team.branch import BranchError, allocate_branch
+from magent2.team.branch import BranchError, allocate_branch, allocate_branches_batch
 
 
 def _run(cmd: list[str], cwd: str) -> int:
@@ -37,3 +37,42 @@ def test_allocate_branch_creates_and_checks_out(tmp_path: Path) -> None:
 def test_allocate_branch_fails_outside_git(tmp_path: Path) -> None:
     with pytest.raises(BranchError):
         allocate_branch(repo_root=str(tmp_path), agent_name="BotB")
+
+
+@pytest.mark.docker
+def test_allocate_branches_batch_creates_missing_without_checkout(tmp_path: Path) -> None:
+    repo = tmp_path / "repo"
+    repo.mkdir()
+    assert _run(["git", "init"], str(repo)) == 0
+    assert _run(["git", "config", "user.email", "test@example.com"], str(repo)) == 0
+    assert _run(["git", "config", "user.name", "Test User"], str(repo)) == 0
+    (repo / "a.txt").write_text("hi")
+    assert _run(["git", "add", "."], str(repo)) == 0
+    assert _run(["git", "commit", "-m", "init"], str(repo)) == 0
+    assert _run(["git", "branch", "feature/T-1/BotA"], str(repo)) == 0
+    head_before = subprocess.check_output(
+        ["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=str(repo), text=True
+    ).strip()
+
+    branches = allocate_branches_batch(
+        repo_root=str(repo),
+        specs=[("BotA", "T-1"), ("BotB", "T-1"), ("BotC", None), ("BotB", "T-1")],
+    )
+
+    assert [b.name for b in branches] == [
+        "feature/T-1/BotA",
+        "feature/T-1/BotB",
+        "feature/task/BotC",
+        "feature/T-1/BotB",
+    ]
+    for b in branches:
+        assert _run(["git", "rev-parse", "--verify", f"refs/heads/{b.name}"], str(repo)) == 0
+    head_after = subprocess.check_output(
+        ["git", "rev-parse", "--abbrev-ref", "HEAD"], cwd=str(repo), text=True
+    ).strip()
+    assert head_after == head_before
+
+
+def test_allocate_branches_batch_fails_outside_git(tmp_path: Path) -> None:
+    with pytest.raises(BranchError):
+        allocate_branches_batch(repo_root=str(tmp_path), specs=[("BotB", None)])
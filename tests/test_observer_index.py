@@ -29,3 +29,55 @@ def test_observer_index_writes_and_reads(redis_url: str) -> None:
     assert isinstance(g, dict)
     assert any(n.get("id") == "user:alice" for n in g.get("nodes", []))
     assert any(e.get("from") == "user:alice" for e in g.get("edges", []))
+
+
+def test_observer_index_disabled_is_noop(monkeypatch: pytest.MonkeyPatch) -> None:
+    from magent2.observability.index import ObserverIndex
+
+    class _ExplodingClient:
+        def __getattr__(self, name: str) -> None:
+            raise AssertionError(f"client should not be used when disabled: {name}")
+
+    monkeypatch.setenv("OBS_INDEX_ENABLED", "0")
+    idx = ObserverIndex.from_client(_ExplodingClient())
+    assert not idx.is_active()
+    idx.record_user_message("c1", "user:a", "agent:b", "hi", None)
+    idx.record_run_started("DevAgent", "c1", None)
+    idx.record_run_completed("DevAgent", "c1", None, errored=False)
+    assert idx.list_conversations() == []
+    assert idx.list_agents() == []
+    assert idx.get_graph("c1") == {"nodes": [], "edges": []}
+    assert idx.conversation_exists("c1") is False
+
+
+def test_get_graph_caps_edges_by_count() -> None:
+    fakeredis = pytest.importorskip("fakeredis")
+    from magent2.observability.index import ObserverIndex
+
+    client = fakeredis.FakeRedis()
+    idx = ObserverIndex(client=client)
+    cid = "conv-edges"
+    for i in range(20):
+        for _ in range(i + 1):
+            idx.record_user_message(cid, f"user:{i}", "agent:DevAgent", "hi", None)
+
+    graph = idx.get_graph(cid, max_edges=5)
+    assert graph is not None
+    counts = sorted((e["count"] for e in graph["edges"]), reverse=True)
+    assert counts == [20, 19, 18, 17, 16]
+    full = idx.get_graph(cid)
+    assert full is not None
+    assert len(full["edges"]) == 20
+
+
+def test_observer_index_writes_survive_pipeline_failure() -> None:
+    from magent2.observability.index import ObserverIndex
+
+    class _BrokenPipelineClient:
+        def pipeline(self, transaction: bool = True) -> None:
+            raise ConnectionError("redis down")
+
+    idx = ObserverIndex(client=_BrokenPipelineClient())
+    idx.record_user_message("c1", "user:a", "agent:b", "hi", None)
+    idx.record_run_started("DevAgent", "c1", None)
+    idx.record_run_completed("DevAgent", "c1", None, errored=False)
@@ -0,0 +1,45 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+import pytest
+
+from magent2.runner.config import clear_config_cache, load_config
+
+
+@pytest.fixture(autouse=True)
+def _clear_config_cache() -> None:
+    clear_config_cache()
+
+
+def test_load_config_is_cached_per_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AGENT_NAME", "Alpha")
+    first = load_config()
+    assert first.agent_name == "Alpha"
+    assert load_config() == first
+
+    monkeypatch.setenv("AGENT_NAME", "Bravo")
+    assert load_config().agent_name == "Bravo"
+    assert load_config({"AGENT_NAME": "Charlie"}).agent_name == "Charlie"
+
+
+def test_load_config_returns_independent_tools_list(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AGENT_TOOLS", "terminal,todo")
+    cfg = load_config()
+    cfg.tools.append("chat")
+    assert load_config().tools == ["terminal", "todo"]
+
+
+def test_instructions_file_change_is_picked_up(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path
+) -> None:
+    path = tmp_path / "instructions.md"
+    path.write_text("first", encoding="utf-8")
+    monkeypatch.setenv("AGENT_INSTRUCTIONS_FILE", str(path))
+    assert load_config().instructions == "first"
+
+    path.write_text("second", encoding="utf-8")
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+    assert load_config().instructions == "second"
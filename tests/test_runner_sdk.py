@@ -303,3 +303,232 @@ def test_adapter_handles_backpressure(monkeypatch: pytest.MonkeyPatch) -> None:
     out = cast(list[BaseStreamEvent], out_any)
     # Even if tokens were dropped, there must be an OutputEvent
     assert out and isinstance(out[-1], OutputEvent) and out[-1].event == "output"
+
+
+def test_adapter_astream_run_yields_events_natively(monkeypatch: pytest.MonkeyPatch) -> None:
+    import asyncio
+
+    _patch_sdk_runner(
+        monkeypatch,
+        [
+            _make_event("raw_response_event", {"delta": "H"}),
+            _make_event("raw_response_event", {"delta": "i"}),
+        ],
+    )
+    runner, env = _build_runner_and_env()
+
+    async def _collect() -> list[BaseStreamEvent]:
+        return [ev async for ev in runner.astream_run(env)]
+
+    out = asyncio.run(_collect())
+    assert [type(ev) for ev in out] == [TokenEvent, TokenEvent, OutputEvent]
+    assert isinstance(out[-1], OutputEvent) and out[-1].text == "Hi"
+
+
+def test_adapter_stream_run_sees_caller_run_context(monkeypatch: pytest.MonkeyPatch) -> None:
+    from magent2.observability import get_run_context, use_run_context
+
+    seen: list[Any] = []
+
+    class _CtxStream:
+        async def stream_events(self) -> AsyncIterator[Any]:
+            seen.append(get_run_context())
+            yield _make_event("raw_response_event", {"delta": "x"})
+
+    class _CtxRunner:
+        @staticmethod
+        def run_streamed(agent: Any, input: str, session: Any) -> _CtxStream:
+            return _CtxStream()
+
+    import magent2.runner.openai_agents_runner as oar
+
+    monkeypatch.setattr(oar, "SDKRunner", _CtxRunner)
+    runner, env = _build_runner_and_env()
+    with use_run_context("run-ctx", env.conversation_id, "DevAgent"):
+        out = list(runner.stream_run(env))
+    assert out and isinstance(out[-1], OutputEvent)
+    assert seen and seen[0] is not None and seen[0].get("run_id") == "run-ctx"
+
+
+def test_session_lru_evicts_least_recently_used() -> None:
+    from agents import Agent
+
+    from magent2.runner.openai_agents_runner import OpenAIAgentsRunner
+
+    runner = OpenAIAgentsRunner(Agent(name="DevAgent", instructions="x"), session_limit=2)
+    runner._sqlite_session_cls = None
+    for cid in ("a", "b", "a", "c"):
+        runner._get_session(cid)
+    assert list(runner._sessions) == ["a", "c"]
+
+
+def test_adapter_reuses_one_event_loop_across_runs(monkeypatch: pytest.MonkeyPatch) -> None:
+    import asyncio
+
+    loops: list[Any] = []
+
+    class _LoopStream:
+        async def stream_events(self) -> AsyncIterator[Any]:
+            loops.append(asyncio.get_running_loop())
+            yield _make_event("raw_response_event", {"delta": "x"})
+
+    class _LoopRunner:
+        @staticmethod
+        def run_streamed(agent: Any, input: str, session: Any) -> _LoopStream:
+            return _LoopStream()
+
+    import magent2.runner.openai_agents_runner as oar
+
+    monkeypatch.setattr(oar, "SDKRunner", _LoopRunner)
+    runner, env = _build_runner_and_env()
+    list(runner.stream_run(env))
+    list(runner.stream_run(env))
+    assert len(loops) == 2 and loops[0] is loops[1]
+
+
+def test_adapter_token_events_serialize_with_defaults(monkeypatch: pytest.MonkeyPatch) -> None:
+    _patch_sdk_runner(monkeypatch, [_make_event("raw_response_event", {"delta": "H"})])
+    runner, env = _build_runner_and_env()
+    token = list(runner.stream_run(env))[0]
+    assert isinstance(token, TokenEvent)
+    payload = token.model_dump(mode="json")
+    assert payload["event"] == "token" and payload["text"] == "H" and payload["index"] == 0
+    assert payload["conversation_id"] == env.conversation_id
+    assert payload["id"] and payload["created_at"]
+
+
+def test_adapter_reuses_start_args_preview_on_completion(monkeypatch: pytest.MonkeyPatch) -> None:
+    sdk_events = [
+        _make_event(
+            "response.tool_call.created",
+            {"id": "tc2", "name": "terminal.run", "arguments": '{"command": "ls", "cwd": "/"}'},
+        ),
+        _make_event(
+            "response.tool_call.completed",
+            {"id": "tc2", "name": "terminal.run", "result": "ok"},
+        ),
+    ]
+    _patch_sdk_runner(monkeypatch, sdk_events)
+
+    runner, env = _build_runner_and_env()
+    out = cast(list[ToolStepEvent], list(runner.stream_run(env))[:2])
+    assert out[0].args == {"command": "ls", "cwd": "/"}
+    assert out[1].status == "success" and out[1].args == out[0].args
+    assert not runner._tool_args_by_id
+
+
+def test_adapter_drops_orphaned_tool_state_after_run(monkeypatch: pytest.MonkeyPatch) -> None:
+    sdk_events = [
+        _make_event(
+            "response.tool_call.created",
+            {"id": "tc3", "name": "todo.create", "arguments": {"title": "x"}},
+        ),
+        _make_event("run_item_stream_event", {"type": "tool_call_item", "name": "todo.list"}),
+    ]
+    _patch_sdk_runner(monkeypatch, sdk_events)
+
+    runner, env = _build_runner_and_env()
+    list(runner.stream_run(env))
+    assert not runner._tool_start_ns and not runner._tool_args_by_id
+    assert not runner._tool_name_by_id and not runner._pending_tool_ids
+
+
+def test_tool_state_is_capped_per_conversation(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGENT2_TOOL_CACHE_MAX", "2")
+    runner, _env = _build_runner_and_env()
+    for call_id in ("a", "b", "c"):
+        runner._tool_start_ns["conv"][call_id] = 1
+    assert list(runner._tool_start_ns["conv"]) == ["b", "c"]
+
+
+def test_sdk_item_fast_path_matches_generic_lookup() -> None:
+    from magent2.runner.openai_agents_runner import OpenAIAgentsRunner
+
+    ResponseFunctionToolCall = type("ResponseFunctionToolCall", (types.SimpleNamespace,), {})
+    ResponseOutputMessage = type("ResponseOutputMessage", (types.SimpleNamespace,), {})
+    ToolCallItem = type("ToolCallItem", (types.SimpleNamespace,), {})
+    MessageOutputItem = type("MessageOutputItem", (types.SimpleNamespace,), {})
+
+    items = [
+        ToolCallItem(
+            raw_item=ResponseFunctionToolCall(name="echo", arguments='{"x":1}', call_id="c1")
+        ),
+        MessageOutputItem(raw_item=ResponseOutputMessage(content=[{"text": "hi"}], role="x")),
+        {"tool_name": "dict_item", "args": {"a": 1}, "output": "ok"},
+        # Unexpected shapes fall back to the generic lookup
+        ToolCallItem(raw_item={"name": "dict_tool", "arguments": "{}"}),
+        ToolCallItem(raw_item=ResponseFunctionToolCall(name="", arguments=None)),
+    ]
+    for item in items:
+        assert OpenAIAgentsRunner._parse_name_args_result(item) == (
+            OpenAIAgentsRunner._get_name(item),
+            OpenAIAgentsRunner._get_args(item),
+            OpenAIAgentsRunner._get_result(item),
+        )
+
+
+@pytest.mark.parametrize("fuse", [False, True])
+def test_adapter_orphan_tool_result_steps(monkeypatch: pytest.MonkeyPatch, fuse: bool) -> None:
+    if fuse:
+        monkeypatch.setenv("MAGENT2_FUSE_ORPHAN_TOOL_STEPS", "1")
+    _patch_sdk_runner(
+        monkeypatch,
+        [
+            _make_event(
+                "run_item_stream_event",
+                {"type": "tool_call_output_item", "name": "echo", "output": "ok"},
+            ),
+        ],
+    )
+    runner, env = _build_runner_and_env()
+    steps = [e for e in runner.stream_run(env) if isinstance(e, ToolStepEvent)]
+    statuses = [s.status for s in steps]
+    assert statuses == (["completed"] if fuse else ["start", "success"])
+    assert steps[-1].name == "echo" and steps[-1].result_summary == "ok"
+    assert len({s.tool_call_id for s in steps}) == 1
+
+
+def test_adapter_coalesces_tokens_when_enabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("MAGENT2_TOKEN_COALESCE_MS", "1000")
+    deltas = ["H", "i", " there, this delta pushes the pending text past the cap", "!"]
+    _patch_sdk_runner(
+        monkeypatch,
+        [_make_event("raw_response_event", {"delta": d}) for d in deltas]
+        + [_make_event("run_item_stream_event", {"name": "echo", "result": "ok"})]
+        + [_make_event("raw_response_event", {"delta": "?"})],
+    )
+    runner, env = _build_runner_and_env()
+    out = list(runner.stream_run(env))
+    tokens = [(e.text, e.index) for e in out if isinstance(e, TokenEvent)]
+    assert tokens == [("".join(deltas[:3]), 0), ("!", 1), ("?", 2)]
+    assert [type(e) for e in out] == [
+        TokenEvent,
+        TokenEvent,
+        ToolStepEvent,
+        TokenEvent,
+        OutputEvent,
+    ]
+    assert isinstance(out[-1], OutputEvent) and out[-1].text == "".join(deltas) + "?"
+
+
+def test_adapter_skips_synthetic_output_when_disabled(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("AGENT_SKIP_SYNTH_OUTPUT", "1")
+    _patch_sdk_runner(monkeypatch, [_make_event("raw_response_event", {"delta": "Hi"})])
+    runner, env = _build_runner_and_env()
+    out = list(runner.stream_run(env))
+    assert [type(e) for e in out] == [TokenEvent]
+
+
+def test_stream_run_on_runner_loop_thread_raises_instead_of_deadlocking() -> None:
+    import contextvars
+
+    from magent2.runner.openai_agents_runner import _run_on_background_loop
+
+    runner, env = _build_runner_and_env()
+
+    async def _nested_run() -> None:
+        # A sync tool runs on the shared loop; a nested blocking run there would never finish
+        with pytest.raises(RuntimeError):
+            list(runner.stream_run(env))
+
+    _run_on_background_loop(_nested_run(), contextvars.copy_context())
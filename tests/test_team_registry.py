@@ -35,3 +35,22 @@ def test_window_person_set_get() -> None:
     reg = TeamRegistry()
     reg.set_window_person("TeamX", "alice@example.com")
     assert reg.get_window_person("TeamX") == "alice@example.com"
+
+
+def test_find_owner_follows_updated_paths() -> None:
+    reg = TeamRegistry()
+    reg.register_agent(team_name="A", agent_name="Alpha", allowed_paths=["./src"])
+    reg.register_agent(team_name="A", agent_name="Bravo", allowed_paths=["src/app/*.py"])
+
+    owner = reg.find_owner_for_path("src/app/main.py")
+    assert owner and owner.agent_name == "Bravo"
+    owner = reg.find_owner_for_path("src\\lib\\util.py")
+    assert owner and owner.agent_name == "Alpha"
+
+    reg.update_agent("Bravo", allowed_paths=["docs/**"])
+    owner = reg.find_owner_for_path("src/app/main.py")
+    assert owner and owner.agent_name == "Alpha"
+
+    reg.register_agent(team_name="A", agent_name="Charlie", allowed_paths=["src/app/main.py"])
+    owner = reg.find_owner_for_path("src/app/main.py")
+    assert owner and owner.agent_name == "Charlie"
@@ -69,3 +69,13 @@ def test_sanitized_env(tmp_script_dir: Path, monkeypatch: pytest.MonkeyPatch) ->
     assert "SECRET_TOKEN=" not in result["stdout"]
     # but should include SAFE_FLAG
     assert "SAFE_FLAG=1" in result["stdout"]
+
+
+def test_output_cap_bounds_large_output_without_blocking(tmp_script_dir: Path) -> None:
+    tool = TerminalTool(allowed_commands=["python3"], output_cap_bytes=100, timeout_seconds=5.0)
+    # far larger than a pipe buffer; must be drained rather than retained
+    result = tool.run("python3 -c \"print('x'*2_000_000)\"")
+    assert result["ok"] is True
+    assert result["truncated"] is True
+    assert len(result["stdout"].encode()) <= 100
+